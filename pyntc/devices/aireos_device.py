@@ -34,7 +34,9 @@ RE_AP_BOOT_OPTIONS = re.compile(
     re.M,
 )
 RE_PEER_REDUNDANCY_STATE = re.compile(r"^\s*Peer\s+State\s*=\s*(.+?)\s*$", re.M)
+RE_REDUNDANCY_MODE = re.compile(r"^\s*Redundancy\s+Mode\s*=\s*(.+?)\s*$", re.M)
 RE_REDUNDANCY_STATE = re.compile(r"^\s*Local\s+State\s*=\s*(.+?)\s*$", re.M)
+RE_VERSION_SEPARATOR = re.compile(r"[-_]")
 RE_WLANS = re.compile(
     r"^(?P<wlan_id>\d+)\s+(?P<profile>\S+)\s*/\s+(?P<ssid>\S+)\s+(?P<status>\S+)\s+(?P<interface>.+?)\s*\S+\s*$", re.M
 )
@@ -58,7 +60,7 @@ def convert_filename_to_version(filename):
     """
     version_match = RE_FILENAME_FIND_VERSION.match(filename)
     version_string = version_match.groupdict()["version"]
-    version = re.sub("-|_", ".", version_string)
+    version = RE_VERSION_SEPARATOR.sub(".", version_string)
     return version
 
 
@@ -1198,7 +1200,7 @@ class AIREOSDevice(BaseDevice):
             >>>
         """
         high_availability = self.show("show redundancy summary")
-        ha_mode = re.search(r"^\s*Redundancy\s+Mode\s*=\s*(.+?)\s*$", high_availability, re.M)
+        ha_mode = RE_REDUNDANCY_MODE.search(high_availability)
         log.debug("Host %s: Redundancy mode: {ha_mode.group(1).lower()}", self.host, ha_mode.group(1).lower())
         return ha_mode.group(1).lower()
 
@@ -1296,7 +1298,7 @@ class AIREOSDevice(BaseDevice):
             boot_command = "boot backup"
         else:
             log.error("Host %s: File not found error for image %s.", self.host, image_name)
-            raise NTCFileNotFoundError(image_name, "'show boot'", self.host)
+            raise NTCFileNotFoundError(hostname=self.host, file=image_name, directory="'show boot'")
         self.config(boot_command)
         self.save()
         if not self.boot_options["sys"] == image_name:
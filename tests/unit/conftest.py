@@ -1,8 +1,14 @@
+import copy
+import itertools
+import json
 import os
+import time
+from types import MappingProxyType
 from unittest import mock
 
 import pytest
 from pyntc.devices import AIREOSDevice, ASADevice, IOSDevice, IOSXEWLCDevice, supported_devices
+from pyntc.devices.aireos_device import RE_PEER_REDUNDANCY_STATE, RE_REDUNDANCY_STATE
 
 
 def get_side_effects(mock_path, side_effects):
@@ -16,6 +22,19 @@ def get_side_effects(mock_path, side_effects):
     return effects
 
 
+# Session caches hand out a deep copy of each value, so no test can change what the next one reads.
+class CopyOnReadDict(dict):
+    def __getitem__(self, key):
+        return copy.deepcopy(super().__getitem__(key))
+
+    def get(self, key, default=None):
+        return copy.deepcopy(super().get(key, default))
+
+
+def get_cached_side_effects(mock_files, side_effects):
+    return [mock_files.get(effect, effect) if isinstance(effect, str) else effect for effect in side_effects]
+
+
 def pytest_generate_tests(metafunc):
     if metafunc.function.__name__ == "test_device_creation":
         metafunc.parametrize(
@@ -26,21 +45,38 @@ def pytest_generate_tests(metafunc):
 
 
 @pytest.fixture
-def aireos_boot_image():
-    return "8.2.170.0"
+def aireos_boot_options(request, aireos_boot_path):
+    with mock.patch(aireos_boot_path, new_callable=mock.PropertyMock) as boot_options:
+        if hasattr(request, "param"):
+            boot_options.return_value = request.param
+        yield boot_options
 
 
 @pytest.fixture
+def aireos_boot_options_value(request, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "boot_options", property(lambda self: request.param))
+
+
+@pytest.fixture(scope="session")
 def aireos_boot_path(aireos_device_path):
     return f"{aireos_device_path}.boot_options"
 
 
 @pytest.fixture
-def aireos_config(aireos_device, aireos_mock_path):
+def aireos_clock(monkeypatch):
+    # Replaces only the driver's time module: sleep() returns at once and each time() reading advances half a second.
+    clock = mock.Mock(spec=time)
+    clock.time.side_effect = itertools.count(step=0.5)
+    monkeypatch.setattr("pyntc.devices.aireos_device.time", clock)
+    return clock
+
+
+@pytest.fixture
+def aireos_config(aireos_device, aireos_fixture_files):
     def _mock(side_effects, existing_device=None, device=aireos_device):
         if existing_device is not None:
             device = existing_device
-        device.native.send_config_set.side_effect = get_side_effects(aireos_mock_path, side_effects)
+        device.native.send_config_set.side_effect = get_cached_side_effects(aireos_fixture_files, side_effects)
         return device
 
     return _mock
@@ -56,14 +92,14 @@ def aireos_device():
             yield device
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aireos_device_path():
     return "pyntc.devices.aireos_device.AIREOSDevice"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aireos_expected_wlans():
-    return {
+    wlans = {
         5: {
             "profile": "guest_cppm",
             "ssid": "guest_cppm",
@@ -107,6 +143,21 @@ def aireos_expected_wlans():
             "interface": "wireless client 102",
         },
     }
+    # Shared by every test in the session, so hand out a read-only view.
+    return MappingProxyType({wlan_id: MappingProxyType(wlan) for wlan_id, wlan in wlans.items()})
+
+
+@pytest.fixture(scope="session")
+def aireos_fixture_files(aireos_mock_path):
+    fixture_files = CopyOnReadDict()
+    for filename in os.listdir(aireos_mock_path):
+        if filename.endswith(".txt"):
+            with open(f"{aireos_mock_path}/{filename}") as fh:
+                fixture_files[filename] = fh.read()
+        elif filename.endswith(".json"):
+            with open(f"{aireos_mock_path}/{filename}") as fh:
+                fixture_files[filename] = json.load(fh)
+    return fixture_files
 
 
 @pytest.fixture
@@ -122,45 +173,57 @@ def aireos_image_booted(aireos_device_path, aireos_device):
     return _mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aireos_mock_path(mock_path):
     return f"{mock_path}/aireos"
 
 
+@pytest.fixture(scope="session")
+def aireos_parsed_redundancy(aireos_fixture_files):
+    return {
+        filename: {
+            "peer": RE_PEER_REDUNDANCY_STATE.search(output).group(1),
+            "state": RE_REDUNDANCY_STATE.search(output).group(1),
+        }
+        for filename, output in aireos_fixture_files.items()
+        if filename.startswith("show_redundancy_summary")
+    }
+
+
 @pytest.fixture
-def aireos_redundancy_mode_path(aireos_device_path):
-    return f"{aireos_device_path}.redundancy_mode"
+def aireos_redundancy_mode(request, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "redundancy_mode", property(lambda self: request.param))
 
 
 @pytest.fixture
-def aireos_send_command(aireos_device, aireos_mock_path):
+def aireos_send_command(aireos_device, aireos_fixture_files):
     def _mock(side_effects, existing_device=None, device=aireos_device):
         if existing_device is not None:
             device = existing_device
-        device.native.send_command.side_effect = get_side_effects(aireos_mock_path, side_effects)
+        device.native.send_command.side_effect = get_cached_side_effects(aireos_fixture_files, side_effects)
         return device
 
     return _mock
 
 
 @pytest.fixture
-def aireos_send_command_timing(aireos_device, aireos_mock_path):
+def aireos_send_command_timing(aireos_device, aireos_fixture_files):
     def _mock(side_effects, existing_device=None, device=aireos_device):
         if existing_device is not None:
             device = existing_device
-        device.native.send_command_timing.side_effect = get_side_effects(aireos_mock_path, side_effects)
+        device.native.send_command_timing.side_effect = get_cached_side_effects(aireos_fixture_files, side_effects)
         return device
 
     return _mock
 
 
 @pytest.fixture
-def aireos_show(aireos_device, aireos_mock_path):
+def aireos_show(aireos_device, aireos_fixture_files):
     def _mock(side_effects, existing_device=None, device=aireos_device):
         if existing_device is not None:
             device = existing_device
-        with mock.patch.object(AIREOSDevice, "show") as mock_show:
-            mock_show.side_effect = get_side_effects(aireos_mock_path, side_effects)
+        with mock.patch.object(AIREOSDevice, "show", new_callable=mock.Mock) as mock_show:
+            mock_show.side_effect = get_cached_side_effects(aireos_fixture_files, side_effects)
         device.show = mock_show
         return device
 
@@ -168,19 +231,19 @@ def aireos_show(aireos_device, aireos_mock_path):
 
 
 @pytest.fixture
-def aireos_show_list(aireos_device, aireos_mock_path):
+def aireos_show_list(aireos_device, aireos_fixture_files):
     def _mock(side_effects, existing_device=None, device=aireos_device):
         if existing_device is not None:
             device = existing_device
-        with mock.patch.object(AIREOSDevice, "show_list") as mock_show_list:
-            mock_show_list.side_effect = get_side_effects(aireos_mock_path, side_effects)
+        with mock.patch.object(AIREOSDevice, "show_list", new_callable=mock.Mock) as mock_show_list:
+            mock_show_list.side_effect = get_cached_side_effects(aireos_fixture_files, side_effects)
         device.show_list = mock_show_list
         return device
 
     return _mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_path():
     filepath = os.path.abspath(__file__)
     dirpath = os.path.dirname(filepath)
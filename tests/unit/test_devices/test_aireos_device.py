@@ -1,4 +1,3 @@
-import json
 from unittest import mock
 
 import pytest
@@ -6,6 +5,39 @@ import pytest
 from pyntc.devices import aireos_device as aireos_module
 from pyntc.devices import AIREOSDevice
 
+BOOT_IMAGE = "8.2.170.0"
+BOOT_OPTIONS_IMAGE_LOADED = {"primary": "8.10.105.0", "backup": "8.8.0.0", "sys": "8.10.105.0"}
+BOOT_OPTIONS_IMAGE_NOT_LOADED = {"primary": "8.9.0.0", "backup": "8.8.0.0", "sys": "8.9.0.0"}
+BOOT_OPTIONS_OLDER_IMAGE = {"primary": "8.8.105.0", "backup": "8.8.0.0", "sys": "8.8.105.0"}
+CONFIG_LIST = ("interface hostname virtual wlc1.site.com", "config interface vlan airway 20")
+CONFIG_LIST_SEND_CONFIG_SET_CALLS = [
+    mock.call(command, enter_config_mode=False, exit_config_mode=False) for command in CONFIG_LIST
+]
+
+
+def get_transfer_download_call(datatype, mode, username, path, filename):
+    return mock.call(
+        [
+            f"transfer download datatype {datatype}",
+            f"transfer download mode {mode}",
+            f"transfer download username {username}",
+            "transfer download password pass",
+            "transfer download serverip 10.1.1.1",
+            f"transfer download path {path}",
+            f"transfer download filename {filename}",
+        ]
+    )
+
+
+TRANSFER_DOWNLOAD_CODE_SFTP_CALL = get_transfer_download_call(
+    "code", "sftp", "user", "images/", "AIR-CT5520-K9-8-10-105-0.aes"
+)
+TRANSFER_DOWNLOAD_CODE_SFTP_INVALID_USER_CALL = get_transfer_download_call(
+    "code", "sftp", "invalid", "images/", "AIR-CT5520-K9-8-10-105-0.aes"
+)
+TRANSFER_DOWNLOAD_CONFIG_FTP_CALL = get_transfer_download_call("config", "ftp", "user", "configs/host/", "latest.cfg")
+TRANSFER_DOWNLOAD_YES_CALL = mock.call("y", auto_find_prompt=False, read_timeout=1000)
+
 
 @pytest.mark.parametrize(
     "filename,version",
@@ -33,18 +65,17 @@ def test_convert_filename_to_version(filename, version):
 )
 @mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
 def test_ap_images_match_expected(
-    mock_ap_boot_options, filename, expected, image_option, aireos_boot_image, aireos_device, aireos_mock_path
+    mock_ap_boot_options, filename, expected, image_option, aireos_device, aireos_fixture_files
 ):
-    with open(f"{aireos_mock_path}/{filename}") as fh:
-        mock_ap_boot_options.return_value = json.load(fh)
-    assert aireos_device._ap_images_match_expected(image_option, aireos_boot_image) is expected
+    mock_ap_boot_options.return_value = aireos_fixture_files[filename]
+    assert aireos_device._ap_images_match_expected(image_option, BOOT_IMAGE) is expected
     mock_ap_boot_options.assert_called()
 
 
 @mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_ap_images_pass_boot_options(mock_ap_boot_options, aireos_device, aireos_boot_image):
+def test_ap_images_pass_boot_options(mock_ap_boot_options, aireos_device):
     ap_boot_options = {"test1": {"primary": "8.2.170.0", "backup": "8.1.170.0", "sys": "8.2.170.0"}}
-    aireos_device._ap_images_match_expected("primary", aireos_boot_image, ap_boot_options)
+    aireos_device._ap_images_match_expected("primary", BOOT_IMAGE, ap_boot_options)
     mock_ap_boot_options.assert_not_called()
 
 
@@ -71,9 +102,9 @@ def test_enter_config(aireos_device):
     (("show_sysinfo.txt", True), ("show_sysinfo_false.txt", False)),
     ids=("True", "False"),
 )
-def test_image_booted(aireos_show, aireos_boot_image, filename, expected):
+def test_image_booted(aireos_show, filename, expected):
     device = aireos_show([filename])
-    image_booted = device._image_booted(aireos_boot_image)
+    image_booted = device._image_booted(BOOT_IMAGE)
     assert image_booted is expected
 
 
@@ -145,19 +176,19 @@ def test_wait_for_ap_image_download(mock_ap_image_stats, aireos_device):
 )
 @mock.patch.object(AIREOSDevice, "ap_image_stats", new_callable=mock.PropertyMock)
 def test_wait_for_ap_image_download_fail(
-    mock_ap_image_stats, filename, expected_counts, aireos_device, aireos_mock_path
+    mock_ap_image_stats, filename, expected_counts, aireos_device, aireos_fixture_files
 ):
-    with open(f"{aireos_mock_path}/{filename}") as fh:
-        mock_ap_image_stats.side_effect = json.load(fh)
+    mock_ap_image_stats.side_effect = aireos_fixture_files[filename]
     with pytest.raises(aireos_module.FileTransferError) as fte:
         aireos_device._wait_for_ap_image_download()
     unsupported, failed = expected_counts
     assert fte.value.message == f"Failed transferring image to AP\nUnsupported: {unsupported}\nFailed: {failed}\n"
 
 
-@mock.patch.object(AIREOSDevice, "ap_image_stats", new_callable=mock.PropertyMock)
-def test_wait_for_ap_image_download_timeout(mock_ap_image_stats, aireos_device):
-    mock_ap_image_stats.return_value = {"count": 2, "downloaded": 1, "unsupported": 0, "failed": 0}
+@pytest.mark.usefixtures("aireos_clock")
+def test_wait_for_ap_image_download_timeout(aireos_device, monkeypatch):
+    ap_image_stats = {"count": 2, "downloaded": 1, "unsupported": 0, "failed": 0}
+    monkeypatch.setattr(AIREOSDevice, "ap_image_stats", ap_image_stats)
     with pytest.raises(aireos_module.FileTransferError) as fte:
         aireos_device._wait_for_ap_image_download(timeout=1)
     assert fte.value.message == (
@@ -165,16 +196,16 @@ def test_wait_for_ap_image_download_timeout(mock_ap_image_stats, aireos_device):
     )
 
 
-@mock.patch.object(AIREOSDevice, "open")
-def test_wait_for_device_to_reboot(mock_open, aireos_device):
-    mock_open.side_effect = [Exception, Exception, True]
+def test_wait_for_device_to_reboot(aireos_device, monkeypatch):
+    mock_open = mock.Mock(side_effect=[Exception, Exception, True])
+    monkeypatch.setattr(aireos_device, "open", mock_open)
     aireos_device._wait_for_device_reboot()
-    mock_open.assert_has_calls([mock.call()] * 3)
+    assert mock_open.call_count == 3
 
 
-@mock.patch.object(AIREOSDevice, "open")
-def test_wait_for_device_to_reboot_error(mock_open, aireos_device):
-    mock_open.side_effect = [Exception]
+@pytest.mark.usefixtures("aireos_clock")
+def test_wait_for_device_to_reboot_error(aireos_device, monkeypatch):
+    monkeypatch.setattr(aireos_device, "open", mock.Mock(side_effect=Exception))
     with pytest.raises(aireos_module.RebootTimeoutError):
         aireos_device._wait_for_device_reboot(1)
 
@@ -183,12 +214,12 @@ def test_wait_for_device_to_reboot_error(mock_open, aireos_device):
 def test_wait_for_peer_to_form(mock_peer_redundancy_state, aireos_device):
     mock_peer_redundancy_state.side_effect = ["n/a", "disabled", "standby hot"]
     aireos_device._wait_for_peer_to_form("standby hot")
-    mock_peer_redundancy_state.assert_has_calls([mock.call()] * 3)
+    assert mock_peer_redundancy_state.call_count == 3
 
 
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_wait_for_peer_to_form_error(mock_peer_redundancy_state, aireos_device):
-    mock_peer_redundancy_state.return_value = "disabled"
+@pytest.mark.usefixtures("aireos_clock")
+def test_wait_for_peer_to_form_error(aireos_device, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "peer_redundancy_state", "disabled")
     with pytest.raises(aireos_module.PeerFailedToFormError):
         aireos_device._wait_for_peer_to_form("standby hot", timeout=1)
 
@@ -201,10 +232,9 @@ def test_wait_for_peer_to_form_error(mock_peer_redundancy_state, aireos_device):
     ),
     ids=("same", "mixed"),
 )
-def test_ap_boot_options(output_filename, expected_filename, aireos_show, aireos_mock_path):
+def test_ap_boot_options(output_filename, expected_filename, aireos_show, aireos_fixture_files):
     device = aireos_show([output_filename])
-    with open(f"{aireos_mock_path}/{expected_filename}") as fh:
-        expected = json.load(fh)
+    expected = aireos_fixture_files[expected_filename]
     assert device.ap_boot_options == expected
 
 
@@ -216,18 +246,17 @@ def test_ap_boot_options(output_filename, expected_filename, aireos_show, aireos
     ),
     ids=("unsupported", "failed"),
 )
-def test_ap_image_stats(output_filename, expected_filename, aireos_show, aireos_mock_path):
+def test_ap_image_stats(output_filename, expected_filename, aireos_show, aireos_fixture_files):
     device = aireos_show([output_filename])
-    with open(f"{aireos_mock_path}/{expected_filename}") as fh:
-        expected = json.load(fh)
+    expected = aireos_fixture_files[expected_filename]
     assert device.ap_image_stats == expected
 
 
 @pytest.mark.parametrize("status", ("primary", "backup"), ids=("primary", "backup"))
-def test_boot_options(aireos_show, aireos_boot_image, status):
+def test_boot_options(aireos_show, status):
     device = aireos_show([f"show_boot_{status}.txt"] * 2)
     boot_option = device.boot_options[status]
-    assert boot_option == aireos_boot_image
+    assert boot_option == BOOT_IMAGE
     assert device.boot_options["sys"] == boot_option
 
 
@@ -243,137 +272,125 @@ def test_boot_options_none(aireos_show):
     assert device.boot_options["sys"] is None
 
 
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_pass_string(mock_enter_config, mock_check_for_errors, aireos_config):
-    command = "boot primary"
-    device = aireos_config([""])
-    result = device.config(command)
-
-    # TODO: Change to list when deprecating config_list
-    assert isinstance(result, str)
-    mock_enter_config.assert_called_once()
-    mock_check_for_errors.assert_called_with(command, result)
-    mock_check_for_errors.assert_called_once()
-    device.native.send_config_set.assert_called_with(command, enter_config_mode=False, exit_config_mode=False)
-    device.native.send_config_set.assert_called_once()
-    device.native.exit_config_mode.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_pass_list(mock_enter_config, mock_check_for_errors, aireos_config):
-    command = ["interface hostname virtual wlc1.site.com", "config interface vlan airway 20"]
-    device = aireos_config(["", ""])
-    result = device.config(command)
-
-    assert isinstance(result, list)
-    assert len(result) == 2
-    mock_enter_config.assert_called_once()
-    mock_check_for_errors.assert_has_calls(mock.call(command[index], result[index]) for index in range(2))
-    device.native.send_config_set.assert_has_calls(
-        mock.call(cmd, enter_config_mode=False, exit_config_mode=False) for cmd in command
-    )
-    device.native.exit_config_mode.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_pass_netmiko_args(mock_enter_config, mock_check_for_errors, aireos_config):
-    command = ["a"]
-    device = aireos_config([1])
-    netmiko_args = {"strip_prompt": True}
-    device.config(command, **netmiko_args)
-
-    device.native.send_config_set.assert_called_with(
-        command[0], enter_config_mode=False, exit_config_mode=False, strip_prompt=True
-    )
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_pass_invalid_netmiko_args(mock_enter_config, mock_check_for_errors, aireos_config):
-    error_message = "send_config_set() got an unexpected keyword argument 'invalid_arg'"
-    device = aireos_config([TypeError(error_message)])
-    netmiko_args = {"invalid_arg": True}
-    with pytest.raises(TypeError) as error:
-        device.config("command", **netmiko_args)
-
-    assert error.value.args[0] == (f"Netmiko Driver's {error_message}")
-    mock_check_for_errors.assert_not_called()
-    device.native.exit_config_mode.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_disable_enter_config(mock_enter_config, mock_check_for_errors, aireos_config):
-    command = ["a"]
-    config_effects = [1]
-    device = aireos_config(config_effects)
-    device.config(command, enter_config_mode=False)
-
-    device.native.send_config_set.assert_called_with(command[0], enter_config_mode=False, exit_config_mode=False)
-    mock_enter_config.assert_not_called()
-    device.native.exit_config_mode.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_disable_exit_config(mock_enter_config, mock_check_for_errors, aireos_config):
-    command = ["a"]
-    config_effects = [1]
-    device = aireos_config(config_effects)
-    device.config(command, exit_config_mode=False)
-
-    device.native.send_config_set.assert_called_with(command[0], enter_config_mode=False, exit_config_mode=False)
-    mock_enter_config.assert_called_once()
-    device.native.exit_config_mode.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_pass_invalid_string_command(mock_enter_config, mock_check_for_errors, aireos_config):
-    command = "invalid command"
-    result = "Incorrect usage. invalid output"
-    mock_check_for_errors.side_effect = [aireos_module.CommandError(command, result)]
-    device = aireos_config(result)
-    with pytest.raises(aireos_module.CommandError) as err:
-        device.config(command)
-
-    device.native.send_config_set.assert_called_with(command, enter_config_mode=False, exit_config_mode=False)
-    mock_check_for_errors.assert_called_once()
-    device.native.exit_config_mode.assert_called_once()
-    assert err.value.command == command
-    assert err.value.cli_error_msg == result
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-@mock.patch.object(AIREOSDevice, "_enter_config")
-def test_config_pass_invalid_list_command(mock_enter_config, mock_check_for_errors, aireos_config):
-    mock_check_for_errors.side_effect = [
-        "valid output",
-        aireos_module.CommandError("invalid command", "Incorrect usage. invalid output"),
-    ]
-    command = ["valid command", "invalid command", "another valid command"]
-    result = ["valid output", "Incorrect usage. invalid output"]
-    device = aireos_config(result)
-    with pytest.raises(aireos_module.CommandListError) as err:
-        device.config(command)
+class TestConfig:
+    @pytest.fixture(autouse=True)
+    def mock_enter_config(self, monkeypatch):
+        mock_enter_config = mock.Mock()
+        monkeypatch.setattr(AIREOSDevice, "_enter_config", mock_enter_config)
+        return mock_enter_config
+
+    @pytest.fixture(autouse=True)
+    def mock_check_for_errors(self, monkeypatch):
+        mock_check_for_errors = mock.Mock()
+        monkeypatch.setattr(AIREOSDevice, "_check_command_output_for_errors", mock_check_for_errors)
+        return mock_check_for_errors
+
+    def test_config_pass_string(self, mock_enter_config, mock_check_for_errors, aireos_config):
+        command = "boot primary"
+        device = aireos_config([""])
+        result = device.config(command)
+
+        # TODO: Change to list when deprecating config_list
+        assert isinstance(result, str)
+        mock_enter_config.assert_called_once()
+        mock_check_for_errors.assert_called_with(command, result)
+        mock_check_for_errors.assert_called_once()
+        device.native.send_config_set.assert_called_with(command, enter_config_mode=False, exit_config_mode=False)
+        device.native.send_config_set.assert_called_once()
+        device.native.exit_config_mode.assert_called_once()
+
+    def test_config_pass_list(self, mock_enter_config, mock_check_for_errors, aireos_config):
+        command = list(CONFIG_LIST)
+        device = aireos_config(["", ""])
+        result = device.config(command)
+
+        assert isinstance(result, list)
+        assert len(result) == 2
+        mock_enter_config.assert_called_once()
+        mock_check_for_errors.assert_has_calls(mock.call(command[index], result[index]) for index in range(2))
+        device.native.send_config_set.assert_has_calls(CONFIG_LIST_SEND_CONFIG_SET_CALLS)
+        device.native.exit_config_mode.assert_called_once()
+
+    def test_config_pass_netmiko_args(self, aireos_config):
+        command = ["a"]
+        device = aireos_config([1])
+        netmiko_args = {"strip_prompt": True}
+        device.config(command, **netmiko_args)
+
+        device.native.send_config_set.assert_called_with(
+            command[0], enter_config_mode=False, exit_config_mode=False, strip_prompt=True
+        )
 
-    device.native.send_config_set.assert_has_calls(
-        (
-            mock.call(command[0], enter_config_mode=False, exit_config_mode=False),
-            mock.call(command[1], enter_config_mode=False, exit_config_mode=False),
+    def test_config_pass_invalid_netmiko_args(self, mock_check_for_errors, aireos_config):
+        error_message = "send_config_set() got an unexpected keyword argument 'invalid_arg'"
+        device = aireos_config([TypeError(error_message)])
+        netmiko_args = {"invalid_arg": True}
+        with pytest.raises(TypeError) as error:
+            device.config("command", **netmiko_args)
+
+        assert error.value.args[0] == (f"Netmiko Driver's {error_message}")
+        mock_check_for_errors.assert_not_called()
+        device.native.exit_config_mode.assert_called_once()
+
+    def test_config_disable_enter_config(self, mock_enter_config, aireos_config):
+        command = ["a"]
+        config_effects = [1]
+        device = aireos_config(config_effects)
+        device.config(command, enter_config_mode=False)
+
+        device.native.send_config_set.assert_called_with(command[0], enter_config_mode=False, exit_config_mode=False)
+        mock_enter_config.assert_not_called()
+        device.native.exit_config_mode.assert_called_once()
+
+    def test_config_disable_exit_config(self, mock_enter_config, aireos_config):
+        command = ["a"]
+        config_effects = [1]
+        device = aireos_config(config_effects)
+        device.config(command, exit_config_mode=False)
+
+        device.native.send_config_set.assert_called_with(command[0], enter_config_mode=False, exit_config_mode=False)
+        mock_enter_config.assert_called_once()
+        device.native.exit_config_mode.assert_not_called()
+
+    def test_config_pass_invalid_string_command(self, mock_check_for_errors, aireos_config):
+        command = "invalid command"
+        result = "Incorrect usage. invalid output"
+        mock_check_for_errors.side_effect = aireos_module.CommandError(command, result)
+        device = aireos_config(result)
+        with pytest.raises(aireos_module.CommandError) as err:
+            device.config(command)
+
+        device.native.send_config_set.assert_called_with(command, enter_config_mode=False, exit_config_mode=False)
+        mock_check_for_errors.assert_called_once()
+        device.native.exit_config_mode.assert_called_once()
+        assert err.value.command == command
+        assert err.value.cli_error_msg == result
+
+    def test_config_pass_invalid_list_command(self, mock_check_for_errors, aireos_config):
+        mock_check_for_errors.side_effect = [
+            "valid output",
+            aireos_module.CommandError("invalid command", "Incorrect usage. invalid output"),
+        ]
+        command = ["valid command", "invalid command", "another valid command"]
+        result = ["valid output", "Incorrect usage. invalid output"]
+        device = aireos_config(result)
+        with pytest.raises(aireos_module.CommandListError) as err:
+            device.config(command)
+
+        device.native.send_config_set.assert_has_calls(
+            (
+                mock.call(command[0], enter_config_mode=False, exit_config_mode=False),
+                mock.call(command[1], enter_config_mode=False, exit_config_mode=False),
+            )
         )
-    )
-    assert (
-        mock.call(command[2], enter_config_mode=False, exit_config_mode=False)
-        not in device.native.send_config_set.call_args_list
-    )
-    mock_check_for_errors.assert_called_with(command[1], result[1])
-    device.native.exit_config_mode.assert_called_once()
-    assert err.value.commands == command[:2]
-    assert err.value.command == command[1]
+        assert (
+            mock.call(command[2], enter_config_mode=False, exit_config_mode=False)
+            not in device.native.send_config_set.call_args_list
+        )
+        mock_check_for_errors.assert_called_with(command[1], result[1])
+        device.native.exit_config_mode.assert_called_once()
+        assert err.value.commands == command[:2]
+        assert err.value.command == command[1]
 
 
 @mock.patch.object(AIREOSDevice, "config")
@@ -399,24 +416,20 @@ def test_confirm_is_active(mock_redundancy_state, mock_is_active, aireos_device)
     mock_redundancy_state.assert_not_called()
 
 
-@mock.patch.object(AIREOSDevice, "is_active")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "redundancy_state", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "close")
-@mock.patch.object(AIREOSDevice, "open")
-@mock.patch("pyntc.devices.aireos_device.ConnectHandler")
-def test_confirm_is_active_not_active(
-    mock_connect_handler, mock_open, mock_close, mock_redundancy_state, mock_peer_redundancy_state, mock_is_active
-):
-    mock_is_active.return_value = False
-    mock_redundancy_state.return_value = "standby hot"
+@mock.patch.multiple(AIREOSDevice, is_active=mock.DEFAULT, close=mock.DEFAULT, open=mock.DEFAULT)
+@mock.patch.multiple(
+    AIREOSDevice, redundancy_state=mock.DEFAULT, peer_redundancy_state=mock.DEFAULT, new_callable=mock.PropertyMock
+)
+def test_confirm_is_active_not_active(**mocks):
+    mocks["is_active"].return_value = False
+    mocks["redundancy_state"].return_value = "standby hot"
     device = AIREOSDevice("host", "user", "password")
     with pytest.raises(aireos_module.DeviceNotActiveError):
         device.confirm_is_active()
 
-    mock_redundancy_state.assert_called_once()
-    mock_peer_redundancy_state.assert_called_once()
-    mock_close.assert_called_once()
+    mocks["redundancy_state"].assert_called_once()
+    mocks["peer_redundancy_state"].assert_called_once()
+    mocks["close"].assert_called_once()
 
 
 @pytest.mark.parametrize("expected", ((True,), (False,)))
@@ -448,615 +461,433 @@ def test_close_not_connected(aireos_device):
     aireos_device.native.disconnect.assert_not_called()
 
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_all(mock_disabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_disabled_wlans.side_effect = [[], [5, 15, 16, 20, 21, 22, 24]]
-    aireos_device.disable_wlans("all")
-    mock_wlans.assert_called()
-    mock_config.assert_called_with(["wlan disable all"])
-
+class TestDisableWlans:
+    @pytest.fixture
+    def wlan_mocks(self, aireos_device, aireos_expected_wlans):
+        with mock.patch.object(AIREOSDevice, "config") as mock_config:
+            with mock.patch.multiple(
+                AIREOSDevice, wlans=mock.DEFAULT, disabled_wlans=mock.DEFAULT, new_callable=mock.PropertyMock
+            ) as mocks:
+                mocks["wlans"].return_value = aireos_expected_wlans
+                mocks["config"] = mock_config
+                yield mocks
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_all_already_disabled(
-    mock_disabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans
-):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_disabled_wlans.return_value = [5, 15, 16, 20, 21, 22, 24]
-    aireos_device.disable_wlans("all")
-    mock_config.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_all_fail(mock_disabled_wlans, mock_wlans, aireos_device, aireos_expected_wlans):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_disabled_wlans.return_value = [16, 21, 24]
-    with pytest.raises(aireos_module.WLANDisableError) as disable_err:
-        aireos_device.disable_wlans("all")
-
-    assert disable_err.value.message == (
-        "Unable to disable WLAN IDs on host\n" "Expected: [5, 15, 16, 20, 21, 22, 24]\n" "Found:    [16, 21, 24]\n"
+    @pytest.mark.parametrize(
+        "wlan_ids,disabled_wlans,expected_calls",
+        (
+            ("all", ([], [5, 15, 16, 20, 21, 22, 24]), [mock.call(["wlan disable all"])]),
+            ("all", ([5, 15, 16, 20, 21, 22, 24],), []),
+            ("all", ([16, 21, 24], [5, 15, 16, 20, 21, 22, 24]), [mock.call(["wlan disable all"])]),
+            ([15, 22], ([16, 21, 24], [15, 16, 21, 22, 24]), [mock.call(["wlan disable 15", "wlan disable 22"])]),
+            ([16, 21], ([16, 21, 24],), []),
+            ([15, 21], ([16, 21, 24], [15, 16, 21, 24]), [mock.call(["wlan disable 15"])]),
+        ),
+        ids=(
+            "all",
+            "all_already_disabled",
+            "all_partially_disabled",
+            "subset",
+            "subset_already_disabled",
+            "subset_partially_disabled",
+        ),
     )
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_all_partially_disabled(
-    mock_disabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans
-):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_disabled_wlans.side_effect = [[16, 21, 24], [5, 15, 16, 20, 21, 22, 24]]
-    aireos_device.disable_wlans("all")
-    mock_wlans.assert_called()
-    mock_config.assert_called_with(["wlan disable all"])
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_subset(mock_disabled_wlans, mock_wlans, mock_config, aireos_device):
-    mock_disabled_wlans.side_effect = [[16, 21, 24], [15, 16, 21, 22, 24]]
-    aireos_device.disable_wlans([15, 22])
-    mock_wlans.assert_not_called()
-    mock_config.assert_called_with(["wlan disable 15", "wlan disable 22"])
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_subset_already_disabled(mock_disabled_wlans, mock_config, aireos_device):
-    mock_disabled_wlans.return_value = [16, 21, 24]
-    aireos_device.disable_wlans([16, 21])
-    mock_config.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_subset_fail(mock_disabled_wlans, mock_config, aireos_device):
-    mock_disabled_wlans.return_value = [16, 21, 24]
-    with pytest.raises(aireos_module.WLANDisableError) as disable_err:
-        aireos_device.disable_wlans([15])
-
-    assert disable_err.value.message == (
-        "Unable to disable WLAN IDs on host\n" "Expected: [15, 16, 21, 24]\n" "Found:    [16, 21, 24]\n"
+    def test_disable_wlans(self, wlan_ids, disabled_wlans, expected_calls, wlan_mocks, aireos_device):
+        wlan_mocks["disabled_wlans"].side_effect = disabled_wlans
+        aireos_device.disable_wlans(wlan_ids)
+        assert wlan_mocks["wlans"].called is (wlan_ids == "all")
+        assert wlan_mocks["config"].call_args_list == expected_calls
+
+    @pytest.mark.parametrize(
+        "wlan_ids,expected",
+        (
+            ("all", "[5, 15, 16, 20, 21, 22, 24]"),
+            ([15], "[15, 16, 21, 24]"),
+        ),
+        ids=("all", "subset"),
     )
+    def test_disable_wlans_fail(self, wlan_ids, expected, wlan_mocks, aireos_device):
+        wlan_mocks["disabled_wlans"].return_value = [16, 21, 24]
+        with pytest.raises(aireos_module.WLANDisableError) as disable_err:
+            aireos_device.disable_wlans(wlan_ids)
 
+        assert disable_err.value.message == (
+            "Unable to disable WLAN IDs on host\n" f"Expected: {expected}\n" "Found:    [16, 21, 24]\n"
+        )
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "disabled_wlans", new_callable=mock.PropertyMock)
-def test_disable_wlans_subset_partially_disabled(mock_disabled_wlans, mock_wlans, mock_config, aireos_device):
-    mock_disabled_wlans.side_effect = [[16, 21, 24], [15, 16, 21, 24]]
-    aireos_device.disable_wlans([15, 21])
-    mock_wlans.assert_not_called()
-    mock_config.assert_called_with(["wlan disable 15"])
-
-
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-def test_disabled_wlans(mock_wlans, aireos_device, aireos_expected_wlans):
-    mock_wlans.return_value = aireos_expected_wlans
+
+def test_disabled_wlans(aireos_device, aireos_expected_wlans, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "wlans", aireos_expected_wlans)
     assert aireos_device.disabled_wlans == [16, 21, 24]
 
 
 def test_enable_from_disable(aireos_device):
-    aireos_device.native.check_enable_mode.side_effect = [False]
-    aireos_device.native.check_config_mode.side_effect = [False]
+    aireos_device.native.check_enable_mode.return_value = False
+    aireos_device.native.check_config_mode.return_value = False
     aireos_device.enable()
     aireos_device.native.enable.assert_called()
     aireos_device.native.exit_config_mode.assert_not_called()
 
 
 def test_enable_from_enable(aireos_device):
-    aireos_device.native.check_enable_mode.side_effect = [True]
-    aireos_device.native.check_config_mode.side_effect = [False]
+    aireos_device.native.check_enable_mode.return_value = True
+    aireos_device.native.check_config_mode.return_value = False
     aireos_device.enable()
     aireos_device.native.enable.assert_not_called()
     aireos_device.native.exit_config_mode.assert_not_called()
 
 
 def test_enable_from_config(aireos_device):
-    aireos_device.native.check_enable_mode.side_effect = [True]
-    aireos_device.native.check_config_mode.side_effect = [True]
+    aireos_device.native.check_enable_mode.return_value = True
+    aireos_device.native.check_config_mode.return_value = True
     aireos_device.enable()
     aireos_device.native.enable.assert_not_called()
     aireos_device.native.exit_config_mode.assert_called()
 
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_all(mock_enabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_enabled_wlans.side_effect = [[], [5, 15, 16, 20, 21, 22, 24]]
-    aireos_device.enable_wlans("all")
-    mock_wlans.assert_called()
-    mock_config.assert_called_with(["wlan enable all"])
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_all_already_enabled(
-    mock_enabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans
-):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_enabled_wlans.return_value = [5, 15, 16, 20, 21, 22, 24]
-    aireos_device.enable_wlans("all")
-    mock_config.assert_not_called()
+class TestEnableWlans:
+    @pytest.fixture
+    def wlan_mocks(self, aireos_device, aireos_expected_wlans):
+        with mock.patch.object(AIREOSDevice, "config") as mock_config:
+            with mock.patch.multiple(
+                AIREOSDevice, wlans=mock.DEFAULT, enabled_wlans=mock.DEFAULT, new_callable=mock.PropertyMock
+            ) as mocks:
+                mocks["wlans"].return_value = aireos_expected_wlans
+                mocks["config"] = mock_config
+                yield mocks
 
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_all_fail(mock_enabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_enabled_wlans.return_value = [5, 15, 20, 22]
-    with pytest.raises(aireos_module.WLANEnableError) as enable_err:
-        aireos_device.enable_wlans("all")
-
-    assert enable_err.value.message == (
-        "Unable to enable WLAN IDs on host\n" "Expected: [5, 15, 16, 20, 21, 22, 24]\n" "Found:    [5, 15, 20, 22]\n"
+    @pytest.mark.parametrize(
+        "wlan_ids,enabled_wlans,expected_calls",
+        (
+            ("all", ([], [5, 15, 16, 20, 21, 22, 24]), [mock.call(["wlan enable all"])]),
+            ("all", ([5, 15, 16, 20, 21, 22, 24],), []),
+            ("all", ([5, 15, 20, 22], [5, 15, 16, 20, 21, 22, 24]), [mock.call(["wlan enable all"])]),
+            ([16, 21], ([5, 15, 20, 22], [5, 15, 16, 21, 22]), [mock.call(["wlan enable 16", "wlan enable 21"])]),
+            ([5, 15], ([5, 15, 20, 22],), []),
+            ([16, 22], ([5, 15, 20, 22], [5, 15, 16, 20, 22]), [mock.call(["wlan enable 16"])]),
+        ),
+        ids=(
+            "all",
+            "all_already_enabled",
+            "all_partially_enabled",
+            "subset",
+            "subset_already_enabled",
+            "subset_partially_enabled",
+        ),
     )
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_all_partially_enabled(
-    mock_enabled_wlans, mock_wlans, mock_config, aireos_device, aireos_expected_wlans
-):
-    mock_wlans.return_value = aireos_expected_wlans
-    mock_enabled_wlans.side_effect = [[5, 15, 20, 22], [5, 15, 16, 20, 21, 22, 24]]
-    aireos_device.enable_wlans("all")
-    mock_wlans.assert_called()
-    mock_config.assert_called_with(["wlan enable all"])
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_subset(mock_enabled_wlans, mock_wlans, mock_config, aireos_device):
-    mock_enabled_wlans.side_effect = [[5, 15, 20, 22], [5, 15, 16, 21, 22]]
-    aireos_device.enable_wlans([16, 21])
-    mock_wlans.assert_not_called()
-    mock_config.assert_called_with(["wlan enable 16", "wlan enable 21"])
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_subset_already_enabled(mock_enabled_wlans, mock_config, aireos_device):
-    mock_enabled_wlans.return_value = [5, 15, 20, 22]
-    aireos_device.enable_wlans([5, 15])
-    mock_config.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_subset_fail(mock_enabled_wlans, mock_config, aireos_device):
-    mock_enabled_wlans.return_value = [5, 15, 20, 22]
-    with pytest.raises(aireos_module.WLANEnableError) as enable_err:
-        aireos_device.enable_wlans([16])
-
-    assert enable_err.value.message == (
-        "Unable to enable WLAN IDs on host\n" "Expected: [5, 15, 16, 20, 22]\n" "Found:    [5, 15, 20, 22]\n"
+    def test_enable_wlans(self, wlan_ids, enabled_wlans, expected_calls, wlan_mocks, aireos_device):
+        wlan_mocks["enabled_wlans"].side_effect = enabled_wlans
+        aireos_device.enable_wlans(wlan_ids)
+        assert wlan_mocks["wlans"].called is (wlan_ids == "all")
+        assert wlan_mocks["config"].call_args_list == expected_calls
+
+    @pytest.mark.parametrize(
+        "wlan_ids,expected",
+        (
+            ("all", "[5, 15, 16, 20, 21, 22, 24]"),
+            ([16], "[5, 15, 16, 20, 22]"),
+        ),
+        ids=("all", "subset"),
     )
+    def test_enable_wlans_fail(self, wlan_ids, expected, wlan_mocks, aireos_device):
+        wlan_mocks["enabled_wlans"].return_value = [5, 15, 20, 22]
+        with pytest.raises(aireos_module.WLANEnableError) as enable_err:
+            aireos_device.enable_wlans(wlan_ids)
 
+        assert enable_err.value.message == (
+            "Unable to enable WLAN IDs on host\n" f"Expected: {expected}\n" "Found:    [5, 15, 20, 22]\n"
+        )
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "enabled_wlans", new_callable=mock.PropertyMock)
-def test_enable_wlans_subset_partially_enabled(mock_enabled_wlans, mock_wlans, mock_config, aireos_device):
-    mock_enabled_wlans.side_effect = [[5, 15, 20, 22], [5, 15, 16, 20, 22]]
-    aireos_device.enable_wlans([16, 22])
-    mock_wlans.assert_not_called()
-    mock_config.assert_called_with(["wlan enable 16"])
-
-
-@mock.patch.object(AIREOSDevice, "wlans", new_callable=mock.PropertyMock)
-def test_enabled_wlans(mock_wlans, aireos_device, aireos_expected_wlans):
-    mock_wlans.return_value = aireos_expected_wlans
+
+def test_enabled_wlans(aireos_device, aireos_expected_wlans, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "wlans", aireos_expected_wlans)
     assert aireos_device.enabled_wlans == [5, 15, 20, 22]
 
 
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-def test_file_copy(
-    mock_boot_options, mock_convert_filename_to_version, aireos_device_path, aireos_show, aireos_send_command_timing
-):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    mock_boot_options.return_value = {"primary": "8.9.0.0", "backup": "8.8.0.0", "sys": "8.9.0.0"}
-    device = aireos_show([[""] * 7, "transfer_download_start_yes.txt"])
-    aireos_send_command_timing(["transfer_download_start.txt"], device)
-    file_copied = device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
-    mock_boot_options.assert_called_once()
-    mock_convert_filename_to_version.assert_called_once()
-    device.show.assert_has_calls(
-        [
-            mock.call(
-                [
-                    "transfer download datatype code",
-                    "transfer download mode sftp",
-                    "transfer download username user",
-                    "transfer download password pass",
-                    "transfer download serverip 10.1.1.1",
-                    "transfer download path images/",
-                    "transfer download filename AIR-CT5520-K9-8-10-105-0.aes",
-                ],
-            ),
-            mock.call("y", auto_find_prompt=False, read_timeout=1000),
-        ],
-    )
-    device.native.send_command_timing.assert_called_with("transfer download start")
-    assert file_copied is True
-
-
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-def test_file_copy_config(mock_convert_filename_to_version, aireos_show, aireos_send_command_timing):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    device = aireos_show([[""] * 7])
-    aireos_send_command_timing(["transfer_download_start_yes.txt"], device)
-    device.file_copy("user", "pass", "10.1.1.1", "configs/host/latest.cfg", protocol="ftp", filetype="config")
-    mock_convert_filename_to_version.assert_not_called()
-    device.show.assert_has_calls(
-        [
-            mock.call(
-                [
-                    "transfer download datatype config",
-                    "transfer download mode ftp",
-                    "transfer download username user",
-                    "transfer download password pass",
-                    "transfer download serverip 10.1.1.1",
-                    "transfer download path configs/host/",
-                    "transfer download filename latest.cfg",
-                ],
-            ),
-        ],
-    )
-    device.native.send_command_timing.assert_called_with("transfer download start")
-
-
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-def test_file_copy_no_copy(mock_boot_options, mock_convert_filename_to_version, aireos_device_path, aireos_show):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    device = aireos_show([])
-    mock_boot_options.return_value = {"primary": "8.10.105.0", "backup": "8.8.0.0", "sys": "8.10.105.0"}
-    file_copied = device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
-    mock_boot_options.assert_called()
-    device.show.assert_not_called()
-    device.native.send_command_timing.assert_not_called()
-    assert file_copied is False
-
-
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-def test_file_copy_error_setup(mock_boot_options, mock_convert_filename_to_version, aireos_show):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    mock_boot_options.return_value = {"primary": "8.8.105.0", "backup": "8.8.0.0", "sys": "8.8.105.0"}
-    device = aireos_show(
-        [
-            aireos_module.CommandListError(
-                ["transfer download datatype code", "transfer download mode"],
-                "transfer download mode",
-                "invalid command",
-            )
-        ]
+class TestFileCopy:
+    @pytest.fixture(autouse=True)
+    def mock_convert_filename_to_version(self):
+        with mock.patch("pyntc.devices.aireos_device.convert_filename_to_version") as mock_convert:
+            mock_convert.return_value = "8.10.105.0"
+            yield mock_convert
+
+    @pytest.mark.parametrize(
+        "aireos_boot_options", [BOOT_OPTIONS_IMAGE_NOT_LOADED], ids=["image_not_loaded"], indirect=True
     )
-    with pytest.raises(aireos_module.FileTransferError) as transfer_error:
-        device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
-    assert transfer_error.value.message == (
-        "\nCommand transfer download mode failed with message: invalid command\n"
-        "Command List: \n"
-        "\ttransfer download datatype code\n"
-        "\ttransfer download mode\n"
+    def test_file_copy(
+        self, aireos_boot_options, mock_convert_filename_to_version, aireos_show, aireos_send_command_timing
+    ):
+        device = aireos_show([[""] * 7, "transfer_download_start_yes.txt"])
+        aireos_send_command_timing(["transfer_download_start.txt"], device)
+        file_copied = device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
+        aireos_boot_options.assert_called_once()
+        mock_convert_filename_to_version.assert_called_once()
+        device.show.assert_has_calls(
+            [
+                TRANSFER_DOWNLOAD_CODE_SFTP_CALL,
+                TRANSFER_DOWNLOAD_YES_CALL,
+            ],
+        )
+        device.native.send_command_timing.assert_called_with("transfer download start")
+        assert file_copied is True
+
+    def test_file_copy_config(self, mock_convert_filename_to_version, aireos_show, aireos_send_command_timing):
+        device = aireos_show([[""] * 7])
+        aireos_send_command_timing(["transfer_download_start_yes.txt"], device)
+        device.file_copy("user", "pass", "10.1.1.1", "configs/host/latest.cfg", protocol="ftp", filetype="config")
+        mock_convert_filename_to_version.assert_not_called()
+        device.show.assert_has_calls(
+            [
+                TRANSFER_DOWNLOAD_CONFIG_FTP_CALL,
+            ],
+        )
+        device.native.send_command_timing.assert_called_with("transfer download start")
+
+    @pytest.mark.parametrize("aireos_boot_options", [BOOT_OPTIONS_IMAGE_LOADED], ids=["image_loaded"], indirect=True)
+    def test_file_copy_no_copy(self, aireos_boot_options, aireos_show):
+        device = aireos_show([])
+        file_copied = device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
+        aireos_boot_options.assert_called()
+        device.show.assert_not_called()
+        device.native.send_command_timing.assert_not_called()
+        assert file_copied is False
+
+    @pytest.mark.parametrize(
+        "aireos_boot_options_value", [BOOT_OPTIONS_OLDER_IMAGE], ids=["older_image"], indirect=True
     )
-    device.show.assert_called_once()
-
+    @pytest.mark.usefixtures("aireos_boot_options_value")
+    def test_file_copy_error_setup(self, aireos_show):
+        device = aireos_show(
+            [
+                aireos_module.CommandListError(
+                    ["transfer download datatype code", "transfer download mode"],
+                    "transfer download mode",
+                    "invalid command",
+                )
+            ]
+        )
+        with pytest.raises(aireos_module.FileTransferError) as transfer_error:
+            device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
+        assert transfer_error.value.message == (
+            "\nCommand transfer download mode failed with message: invalid command\n"
+            "Command List: \n"
+            "\ttransfer download datatype code\n"
+            "\ttransfer download mode\n"
+        )
+        device.show.assert_called_once()
 
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-def test_file_copy_yes_command_error(
-    mock_boot_options, mock_convert_filename_to_version, aireos_show, aireos_send_command_timing
-):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    mock_boot_options.return_value = {"primary": "8.8.105.0", "backup": "8.8.0.0", "sys": "8.8.105.0"}
-    device = aireos_show([[""] * 7, aireos_module.CommandError("y", "Incorrect Usage: inalid command 'y'")])
-    aireos_send_command_timing(["transfer_download_start.txt"])
-    with pytest.raises(aireos_module.FileTransferError) as transfer_error:
-        device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
-    assert transfer_error.value.message == (
-        f"{aireos_module.FileTransferError.default_message}\n\n"
-        "Command y was not successful: Incorrect Usage: inalid command 'y'"
+    @pytest.mark.parametrize(
+        "aireos_boot_options_value", [BOOT_OPTIONS_OLDER_IMAGE], ids=["older_image"], indirect=True
     )
-    device.show.assert_has_calls(
-        [
-            mock.call(
-                [
-                    "transfer download datatype code",
-                    "transfer download mode sftp",
-                    "transfer download username user",
-                    "transfer download password pass",
-                    "transfer download serverip 10.1.1.1",
-                    "transfer download path images/",
-                    "transfer download filename AIR-CT5520-K9-8-10-105-0.aes",
-                ],
-            ),
-            mock.call("y", auto_find_prompt=False, read_timeout=1000),
-        ],
-    )
-    device.native.send_command_timing.assert_called_with("transfer download start")
+    @pytest.mark.usefixtures("aireos_boot_options_value")
+    def test_file_copy_yes_command_error(self, aireos_show, aireos_send_command_timing):
+        device = aireos_show([[""] * 7, aireos_module.CommandError("y", "Incorrect Usage: inalid command 'y'")])
+        aireos_send_command_timing(["transfer_download_start.txt"])
+        with pytest.raises(aireos_module.FileTransferError) as transfer_error:
+            device.file_copy("user", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
+        assert transfer_error.value.message == (
+            f"{aireos_module.FileTransferError.default_message}\n\n"
+            "Command y was not successful: Incorrect Usage: inalid command 'y'"
+        )
+        device.show.assert_has_calls(
+            [
+                TRANSFER_DOWNLOAD_CODE_SFTP_CALL,
+                TRANSFER_DOWNLOAD_YES_CALL,
+            ],
+        )
+        device.native.send_command_timing.assert_called_with("transfer download start")
 
+    @pytest.mark.parametrize(
+        "aireos_boot_options_value", [BOOT_OPTIONS_OLDER_IMAGE], ids=["older_image"], indirect=True
+    )
+    @pytest.mark.usefixtures("aireos_boot_options_value")
+    def test_file_copy_error_during_transfer(self, aireos_show, aireos_send_command_timing):
+        device = aireos_show([[""] * 7, aireos_module.CommandError("transfer download start", "Auth failure")])
+        aireos_send_command_timing(["transfer_download_start.txt"], device)
+        with pytest.raises(aireos_module.FileTransferError) as transfer_error:
+            device.file_copy("invalid", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
+        assert transfer_error.value.message == (
+            f"{aireos_module.FileTransferError.default_message}\n\n"
+            "Command transfer download start was not successful: Auth failure"
+        )
+        device.show.assert_has_calls(
+            [
+                TRANSFER_DOWNLOAD_CODE_SFTP_INVALID_USER_CALL,
+                TRANSFER_DOWNLOAD_YES_CALL,
+            ],
+        )
 
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-def test_file_copy_error_during_transfer(
-    mock_boot_options, mock_convert_filename_to_version, aireos_show, aireos_send_command_timing
-):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    mock_boot_options.return_value = {"primary": "8.8.105.0", "backup": "8.8.0.0", "sys": "8.8.105.0"}
-    device = aireos_show([[""] * 7, aireos_module.CommandError("transfer download start", "Auth failure")])
-    aireos_send_command_timing(["transfer_download_start.txt"], device)
-    with pytest.raises(aireos_module.FileTransferError) as transfer_error:
-        device.file_copy("invalid", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
-    assert transfer_error.value.message == (
-        f"{aireos_module.FileTransferError.default_message}\n\n"
-        "Command transfer download start was not successful: Auth failure"
+    @pytest.mark.parametrize(
+        "aireos_boot_options_value", [BOOT_OPTIONS_OLDER_IMAGE], ids=["older_image"], indirect=True
     )
-    device.show.assert_has_calls(
-        [
-            mock.call(
-                [
-                    "transfer download datatype code",
-                    "transfer download mode sftp",
-                    "transfer download username invalid",
-                    "transfer download password pass",
-                    "transfer download serverip 10.1.1.1",
-                    "transfer download path images/",
-                    "transfer download filename AIR-CT5520-K9-8-10-105-0.aes",
-                ],
+    @pytest.mark.usefixtures("aireos_boot_options_value")
+    def test_file_copy_error_other(self, aireos_show, aireos_send_command_timing):
+        device = aireos_show([[""] * 7])
+        aireos_send_command_timing([Exception], device)
+        with pytest.raises(aireos_module.FileTransferError) as transfer_error:
+            device.file_copy("invalid", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
+        assert transfer_error.value.message == aireos_module.FileTransferError.default_message
+
+
+class TestInstallOs:
+    @pytest.fixture(autouse=True)
+    def install_os_mocks(self):
+        with mock.patch.multiple(
+            AIREOSDevice,
+            enable_wlans=mock.DEFAULT,
+            disable_wlans=mock.DEFAULT,
+            set_boot_options=mock.DEFAULT,
+            reboot=mock.DEFAULT,
+            _wait_for_device_reboot=mock.DEFAULT,
+            _wait_for_peer_to_form=mock.DEFAULT,
+        ) as mocks:
+            with mock.patch.object(
+                AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock
+            ) as mock_peer_redundancy_state:
+                mocks["peer_redundancy_state"] = mock_peer_redundancy_state
+                yield mocks
+
+    @pytest.mark.parametrize(
+        "image_booted,install_kwargs,side_effects,expected,expected_calls",
+        (
+            (
+                [False, True],
+                {},
+                {},
+                True,
+                {
+                    "_image_booted": [mock.call(BOOT_IMAGE)] * 2,
+                    "set_boot_options": [mock.call(BOOT_IMAGE)],
+                    "reboot": [mock.call(controller="both", save_config=True)],
+                    "peer_redundancy_state": [mock.call()],
+                    "disable_wlans": [],
+                    "enable_wlans": [],
+                    "_wait_for_peer_to_form": [mock.call(mock.ANY)],
+                    "_wait_for_device_reboot": [mock.call(timeout=3600)],
+                },
             ),
-            mock.call("y", auto_find_prompt=False, read_timeout=1000),
-        ],
-    )
-
-
-@mock.patch("pyntc.devices.aireos_device.convert_filename_to_version")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-def test_file_copy_error_other(
-    mock_boot_options, mock_convert_filename_to_version, aireos_show, aireos_send_command_timing
-):
-    mock_convert_filename_to_version.return_value = "8.10.105.0"
-    mock_boot_options.return_value = {"primary": "8.8.105.0", "backup": "8.8.0.0", "sys": "8.8.105.0"}
-    device = aireos_show([[""] * 7])
-    aireos_send_command_timing([Exception], device)
-    with pytest.raises(aireos_module.FileTransferError) as transfer_error:
-        device.file_copy("invalid", "pass", "10.1.1.1", "images/AIR-CT5520-K9-8-10-105-0.aes")
-    assert transfer_error.value.message == aireos_module.FileTransferError.default_message
-
-
-@mock.patch.object(AIREOSDevice, "enable_wlans")
-@mock.patch.object(AIREOSDevice, "disable_wlans")
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    mock_disable_wlans,
-    mock_enable_wlans,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False, True])
-    assert device.install_os(aireos_boot_image) is True
-    device._image_booted.assert_has_calls([mock.call(aireos_boot_image)] * 2)
-    mock_set_boot_options.assert_has_calls([mock.call(aireos_boot_image)])
-    mock_reboot.assert_called_with(controller="both", save_config=True)
-    mock_peer_redundancy_state.assert_called()
-    mock_disable_wlans.assert_not_called()
-    mock_enable_wlans.assert_not_called()
-    mock_wait_peer.assert_called()
-    mock_wait_reboot.assert_called()
-
-
-def test_install_os_no_install(aireos_image_booted, aireos_boot_image):
-    device = aireos_image_booted([True])
-    assert device.install_os(aireos_boot_image) is False
-    device._image_booted.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_error(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False, False])
-    with pytest.raises(aireos_module.OSInstallError) as boot_error:
-        device.install_os(aireos_boot_image)
-    assert boot_error.value.message == f"{device.host} was unable to boot into {aireos_boot_image}"
-    device._image_booted.assert_has_calls([mock.call(aireos_boot_image)] * 2)
-
-
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_error_peer(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    mock_peer_redundancy_state.side_effect = ["standby hot", "unknown"]
-    mock_wait_peer.side_effect = [aireos_module.PeerFailedToFormError("host", "standby hot", "unknown")]
-    device = aireos_image_booted([False, True])
-    with pytest.raises(aireos_module.OSInstallError) as boot_error:
-        device.install_os(aireos_boot_image)
-    assert (
-        boot_error.value.message
-        == f"Host {device.host}: {device.host}-standby was unable to boot into {aireos_boot_image}-standby hot"
+            (
+                [True],
+                {},
+                {},
+                False,
+                {"_image_booted": [mock.call(BOOT_IMAGE)]},
+            ),
+            (
+                [False, False],
+                {},
+                {},
+                aireos_module.OSInstallError("host", BOOT_IMAGE),
+                {"_image_booted": [mock.call(BOOT_IMAGE)] * 2},
+            ),
+            (
+                [False, True],
+                {},
+                {
+                    "peer_redundancy_state": ["standby hot", "unknown"],
+                    "_wait_for_peer_to_form": [aireos_module.PeerFailedToFormError("host", "standby hot", "unknown")],
+                },
+                aireos_module.OSInstallError("Host host: host-standby", f"{BOOT_IMAGE}-standby hot"),
+                {"_image_booted": [mock.call(BOOT_IMAGE)] * 2},
+            ),
+            (
+                [False, True],
+                {"controller": "self", "save_config": False},
+                {},
+                True,
+                {"reboot": [mock.call(controller="self", save_config=False)]},
+            ),
+            (
+                [False, True],
+                {"disable_wlans": "all"},
+                {},
+                True,
+                {
+                    "_image_booted": [mock.call(BOOT_IMAGE)] * 2,
+                    "set_boot_options": [mock.call(BOOT_IMAGE)],
+                    "reboot": [mock.call(controller="both", save_config=True)],
+                    "peer_redundancy_state": [mock.call()],
+                    "disable_wlans": [mock.call("all")],
+                    "enable_wlans": [mock.call("all")],
+                },
+            ),
+            (
+                [False, True],
+                {"disable_wlans": [1, 3, 7]},
+                {},
+                True,
+                {
+                    "_image_booted": [mock.call(BOOT_IMAGE)] * 2,
+                    "set_boot_options": [mock.call(BOOT_IMAGE)],
+                    "reboot": [mock.call(controller="both", save_config=True)],
+                    "peer_redundancy_state": [mock.call()],
+                    "disable_wlans": [mock.call([1, 3, 7])],
+                    "enable_wlans": [mock.call([1, 3, 7])],
+                },
+            ),
+            (
+                [False],
+                {"disable_wlans": [1, 3, 7]},
+                {"disable_wlans": [aireos_module.WLANDisableError("host", [1, 3, 7], [1, 3])]},
+                aireos_module.WLANDisableError("host", [1, 3, 7], [1, 3]),
+                {
+                    "_image_booted": [mock.call(BOOT_IMAGE)],
+                    "set_boot_options": [mock.call(BOOT_IMAGE)],
+                    "reboot": [],
+                    "peer_redundancy_state": [mock.call()],
+                    "enable_wlans": [],
+                },
+            ),
+            (
+                [False],
+                {"disable_wlans": [1, 3, 7]},
+                {"enable_wlans": [aireos_module.WLANEnableError("host", [1, 3, 7], [1, 3])]},
+                aireos_module.WLANEnableError("host", [1, 3, 7], [1, 3]),
+                {
+                    "_image_booted": [mock.call(BOOT_IMAGE)],
+                    "set_boot_options": [mock.call(BOOT_IMAGE)],
+                    "reboot": [mock.call(controller="both", save_config=True)],
+                    "peer_redundancy_state": [mock.call()],
+                },
+            ),
+        ),
+        ids=(
+            "install",
+            "no_install",
+            "error",
+            "error_peer",
+            "pass_controller",
+            "disable_all_wlans",
+            "disable_select_wlans",
+            "disable_wlans_error_disabling",
+            "disable_wlans_error_enabling",
+        ),
     )
-    device._image_booted.assert_has_calls([mock.call(aireos_boot_image)] * 2)
+    def test_install_os(
+        self,
+        image_booted,
+        install_kwargs,
+        side_effects,
+        expected,
+        expected_calls,
+        install_os_mocks,
+        aireos_image_booted,
+    ):
+        device = aireos_image_booted(image_booted)
+        for name, side_effect in side_effects.items():
+            install_os_mocks[name].side_effect = side_effect
+
+        if isinstance(expected, aireos_module.NTCError):
+            with pytest.raises(type(expected)) as install_error:
+                device.install_os(BOOT_IMAGE, **install_kwargs)
+            assert install_error.value.message == expected.message
+        else:
+            assert device.install_os(BOOT_IMAGE, **install_kwargs) is expected
+
+        mocks = dict(install_os_mocks, _image_booted=device._image_booted)
+        for name, calls in expected_calls.items():
+            assert mocks[name].call_args_list == calls
 
 
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_pass_controller(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False, True])
-    assert device.install_os(aireos_boot_image, controller="self", save_config=False) is True
-    mock_reboot.assert_called_with(controller="self", save_config=False)
-
-
-@mock.patch.object(AIREOSDevice, "enable_wlans")
-@mock.patch.object(AIREOSDevice, "disable_wlans")
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_disable_all_wlans(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    mock_disable_wlans,
-    mock_enable_wlans,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False, True])
-    assert device.install_os(aireos_boot_image, disable_wlans="all") is True
-    device._image_booted.assert_has_calls([mock.call(aireos_boot_image)] * 2)
-    mock_set_boot_options.assert_has_calls([mock.call(aireos_boot_image)])
-    mock_reboot.assert_called_with(controller="both", save_config=True)
-    mock_peer_redundancy_state.assert_called()
-    mock_disable_wlans.assert_called_with("all")
-    mock_enable_wlans.assert_called_with("all")
-
-
-@mock.patch.object(AIREOSDevice, "enable_wlans")
-@mock.patch.object(AIREOSDevice, "disable_wlans")
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_disable_select_wlans(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    mock_disable_wlans,
-    mock_enable_wlans,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False, True])
-    assert device.install_os(aireos_boot_image, disable_wlans=[1, 3, 7]) is True
-    device._image_booted.assert_has_calls([mock.call(aireos_boot_image)] * 2)
-    mock_set_boot_options.assert_has_calls([mock.call(aireos_boot_image)])
-    mock_reboot.assert_called_with(controller="both", save_config=True)
-    mock_peer_redundancy_state.assert_called()
-    mock_disable_wlans.assert_called_with([1, 3, 7])
-    mock_enable_wlans.assert_called_with([1, 3, 7])
-
-
-@mock.patch.object(AIREOSDevice, "enable_wlans")
-@mock.patch.object(AIREOSDevice, "disable_wlans")
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_disable_wlans_error_disabling(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    mock_disable_wlans,
-    mock_enable_wlans,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False])
-    mock_disable_wlans.side_effect = [aireos_module.WLANDisableError(device.host, [1, 3, 7], [1, 3])]
-    with pytest.raises(aireos_module.WLANDisableError):
-        device.install_os(aireos_boot_image, disable_wlans=[1, 3, 7])
-
-    device._image_booted.assert_called_once()
-    mock_set_boot_options.assert_called_once()
-    mock_reboot.assert_not_called()
-    mock_peer_redundancy_state.assert_called_once()
-    mock_enable_wlans.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "enable_wlans")
-@mock.patch.object(AIREOSDevice, "disable_wlans")
-@mock.patch.object(AIREOSDevice, "set_boot_options")
-@mock.patch.object(AIREOSDevice, "reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_device_reboot")
-@mock.patch.object(AIREOSDevice, "_wait_for_peer_to_form")
-@mock.patch.object(AIREOSDevice, "peer_redundancy_state", new_callable=mock.PropertyMock)
-def test_install_os_disable_wlans_error_enabling(
-    mock_peer_redundancy_state,
-    mock_wait_peer,
-    mock_wait_reboot,
-    mock_reboot,
-    mock_set_boot_options,
-    mock_disable_wlans,
-    mock_enable_wlans,
-    aireos_image_booted,
-    aireos_boot_image,
-):
-    device = aireos_image_booted([False])
-    mock_enable_wlans.side_effect = [aireos_module.WLANEnableError(device.host, [1, 3, 7], [1, 3])]
-    with pytest.raises(aireos_module.WLANEnableError):
-        device.install_os(aireos_boot_image, disable_wlans=[1, 3, 7])
-
-    device._image_booted.assert_called_once()
-    mock_set_boot_options.assert_called_once()
-    mock_reboot.assert_called_once()
-    mock_peer_redundancy_state.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "redundancy_state", new_callable=mock.PropertyMock)
 @pytest.mark.parametrize(
     "redundancy_state,expected",
     (
@@ -1066,77 +897,49 @@ def test_install_os_disable_wlans_error_enabling(
     ),
     ids=("active", "standby_hot", "unsupported"),
 )
-def test_is_active(mock_redundancy_state, aireos_device, redundancy_state, expected):
-    mock_redundancy_state.return_value = redundancy_state
+def test_is_active(aireos_device, redundancy_state, expected, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "redundancy_state", redundancy_state)
     actual = aireos_device.is_active()
     assert actual is expected
 
 
-@mock.patch("pyntc.devices.aireos_device.ConnectHandler")
-@mock.patch.object(AIREOSDevice, "connected", new_callable=mock.PropertyMock)
-def test_open_prompt_found(mock_connected, mock_connect_handler, aireos_device):
-    mock_connected.return_value = True
-    aireos_device.open()
-    assert aireos_device._connected is True
-    aireos_device.native.find_prompt.assert_called()
-    mock_connect_handler.assert_not_called()
-    mock_connected.assert_has_calls((mock.call(), mock.call()))
-
-
-@mock.patch("pyntc.devices.aireos_device.ConnectHandler")
-@mock.patch.object(AIREOSDevice, "connected", new_callable=mock.PropertyMock)
-def test_open_prompt_not_found(mock_connected, mock_connect_handler, aireos_device):
-    mock_connected.side_effect = [True, False]
-    aireos_device.native.find_prompt.side_effect = [Exception]
-    aireos_device.open()
-    assert aireos_device._connected is True
-    mock_connected.assert_has_calls((mock.call(), mock.call()))
-    mock_connect_handler.assert_called()
-
-
-@mock.patch("pyntc.devices.aireos_device.ConnectHandler")
-@mock.patch.object(AIREOSDevice, "connected", new_callable=mock.PropertyMock)
-def test_open_not_connected(mock_connected, mock_connect_handler, aireos_device):
-    mock_connected.return_value = False
-    aireos_device._connected = False
-    aireos_device.open()
-    assert aireos_device._connected is True
-    aireos_device.native.find_prompt.assert_not_called()
-    mock_connected.assert_has_calls((mock.call(), mock.call()))
-    mock_connect_handler.assert_called()
-
-
-@mock.patch("pyntc.devices.aireos_device.ConnectHandler")
-@mock.patch.object(AIREOSDevice, "connected", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "confirm_is_active")
-def test_open_standby(mock_confirm, mock_connected, mock_connect_handler, aireos_device):
-    mock_connected.side_effect = [False, False, True]
-    mock_confirm.side_effect = [aireos_module.DeviceNotActiveError("host1", "standby", "active")]
-    with pytest.raises(aireos_module.DeviceNotActiveError):
-        aireos_device.open()
-
-    aireos_device.native.find_prompt.assert_not_called()
-    mock_connect_handler.assert_called()
-    mock_connected.assert_has_calls((mock.call(),) * 2)
-
+class TestOpen:
+    @pytest.fixture
+    def open_mocks(self, aireos_device):
+        with mock.patch("pyntc.devices.aireos_device.ConnectHandler") as mock_connect_handler:
+            with mock.patch.object(AIREOSDevice, "connected", new_callable=mock.PropertyMock) as mock_connected:
+                yield {"ConnectHandler": mock_connect_handler, "connected": mock_connected}
 
-@pytest.mark.parametrize(
-    "filename,expected",
-    (
-        ("show_redundancy_summary_sso_enabled", "standby hot"),
-        ("show_redundancy_summary_standby", "active"),
-        ("show_redundancy_summary_standalone", "disabled"),
-    ),
-    ids=("standby_hot", "active", "disabled"),
-)
-def test_peer_redundancy_state(filename, expected, aireos_show):
-    device = aireos_show([f"{filename}.txt"])
-    assert device.peer_redundancy_state == expected
+    @pytest.mark.parametrize(
+        "connected,find_prompt_effect,find_prompt_called,reconnected",
+        (
+            ([True, True], None, True, False),
+            ([True, False], Exception, True, True),
+            ([False, False], None, False, True),
+        ),
+        ids=("prompt_found", "prompt_not_found", "not_connected"),
+    )
+    def test_open(self, connected, find_prompt_effect, find_prompt_called, reconnected, aireos_device, open_mocks):
+        open_mocks["connected"].side_effect = connected
+        aireos_device._connected = connected[0]
+        native = aireos_device.native
+        native.find_prompt.side_effect = find_prompt_effect
+        aireos_device.open()
+        assert aireos_device._connected is True
+        assert native.find_prompt.called is find_prompt_called
+        assert open_mocks["ConnectHandler"].called is reconnected
+        assert open_mocks["connected"].call_count == 2
 
+    @mock.patch.object(AIREOSDevice, "confirm_is_active")
+    def test_open_standby(self, mock_confirm, aireos_device, open_mocks):
+        open_mocks["connected"].side_effect = [False, False, True]
+        mock_confirm.side_effect = aireos_module.DeviceNotActiveError("host1", "standby", "active")
+        with pytest.raises(aireos_module.DeviceNotActiveError):
+            aireos_device.open()
 
-def test_peer_redundancy_state_unsupported(aireos_show):
-    device = aireos_show([aireos_module.CommandError("show redundancy summary", "unsupported")])
-    assert device.peer_redundancy_state is None
+        aireos_device.native.find_prompt.assert_not_called()
+        open_mocks["ConnectHandler"].assert_called()
+        assert open_mocks["connected"].call_count == 2
 
 
 @pytest.mark.parametrize(
@@ -1148,11 +951,8 @@ def test_peer_redundancy_state_unsupported(aireos_show):
     ),
     ids=("standby_hot", "active", "standalone"),
 )
-def test_re_peer_redundancy_state(filename, expected, aireos_mock_path):
-    with open(f"{aireos_mock_path}/{filename}.txt") as fh:
-        show_redundancy = fh.read()
-    re_redundancy_state = aireos_module.RE_PEER_REDUNDANCY_STATE.search(show_redundancy)
-    actual = re_redundancy_state.group(1)
+def test_re_peer_redundancy_state(filename, expected, aireos_parsed_redundancy):
+    actual = aireos_parsed_redundancy[f"{filename}.txt"]["peer"]
     assert actual == expected
 
 
@@ -1165,66 +965,67 @@ def test_re_peer_redundancy_state(filename, expected, aireos_mock_path):
     ),
     ids=("active", "standby_hot", "standalone"),
 )
-def test_re_redundancy_state(filename, expected, aireos_mock_path):
-    with open(f"{aireos_mock_path}/{filename}.txt") as fh:
-        show_redundancy = fh.read()
-    re_redundancy_state = aireos_module.RE_REDUNDANCY_STATE.search(show_redundancy)
-    actual = re_redundancy_state.group(1)
+def test_re_redundancy_state(filename, expected, aireos_parsed_redundancy):
+    actual = aireos_parsed_redundancy[f"{filename}.txt"]["state"]
     assert actual == expected
 
 
-@mock.patch.object(AIREOSDevice, "save")
-def test_reboot_confirm(mock_save, aireos_send_command_timing, aireos_redundancy_mode_path):
-    device = aireos_send_command_timing(["reset_system_confirm.txt", "reset_system_restart.txt"])
-    with mock.patch(aireos_redundancy_mode_path, new_callable=mock.PropertyMock) as redundnacy_mode:
-        redundnacy_mode.return_value = "sso enabled"
-        device.reboot()
-    device.native.send_command_timing.assert_has_calls([mock.call("reset system self"), mock.call("y")])
-    mock_save.assert_called()
-
+class TestReboot:
+    @pytest.fixture(autouse=True)
+    def mock_save(self):
+        with mock.patch.object(AIREOSDevice, "save") as mock_save:
+            yield mock_save
 
-@mock.patch.object(AIREOSDevice, "save")
-def test_reboot_confirm_deprecation(mock_save, aireos_send_command_timing, aireos_redundancy_mode_path):
-    device = aireos_send_command_timing(["reset_system_confirm.txt", "reset_system_restart.txt"])
-    with mock.patch(aireos_redundancy_mode_path, new_callable=mock.PropertyMock) as redundnacy_mode:
-        redundnacy_mode.return_value = "sso enabled"
-        device.reboot(confirm=True)
-    device.native.send_command_timing.assert_has_calls([mock.call("reset system self"), mock.call("y")])
-    mock_save.assert_called()
-
-
-@mock.patch.object(AIREOSDevice, "save")
-def test_reboot_confirm_args(mock_save, aireos_send_command_timing, aireos_redundancy_mode_path):
-    device = aireos_send_command_timing(
-        ["reset_system_save.txt", "reset_system_confirm.txt", "reset_system_restart.txt"]
-    )
-    with mock.patch(aireos_redundancy_mode_path, new_callable=mock.PropertyMock) as redundnacy_mode:
-        redundnacy_mode.return_value = "sso enabled"
-        device.reboot(controller="both", save_config=False)
-    device.native.send_command_timing.assert_has_calls([mock.call("reset system both"), mock.call("n"), mock.call("y")])
-    mock_save.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "save")
-def test_reboot_confirm_standalone(mock_save, aireos_send_command_timing, aireos_redundancy_mode_path):
-    device = aireos_send_command_timing(["reset_system_confirm.txt", "reset_system_restart.txt"])
-    with mock.patch(aireos_redundancy_mode_path, new_callable=mock.PropertyMock) as redundnacy_mode:
-        redundnacy_mode.return_value = "sso disabled"
-        device.reboot()
-    device.native.send_command_timing.assert_has_calls([mock.call("reset system"), mock.call("y")])
-    mock_save.assert_called()
-
-
-@mock.patch.object(AIREOSDevice, "save")
-def test_reboot_confirm_standalone_args(mock_save, aireos_send_command_timing, aireos_redundancy_mode_path):
-    device = aireos_send_command_timing(
-        ["reset_system_save.txt", "reset_system_confirm.txt", "reset_system_restart.txt"]
+    @pytest.mark.parametrize(
+        "aireos_redundancy_mode,reboot_kwargs,side_effects,expected_calls,save_called",
+        (
+            (
+                "sso enabled",
+                {},
+                ["reset_system_confirm.txt", "reset_system_restart.txt"],
+                [mock.call("reset system self"), mock.call("y")],
+                True,
+            ),
+            (
+                "sso enabled",
+                {"confirm": True},
+                ["reset_system_confirm.txt", "reset_system_restart.txt"],
+                [mock.call("reset system self"), mock.call("y")],
+                True,
+            ),
+            (
+                "sso enabled",
+                {"controller": "both", "save_config": False},
+                ["reset_system_save.txt", "reset_system_confirm.txt", "reset_system_restart.txt"],
+                [mock.call("reset system both"), mock.call("n"), mock.call("y")],
+                False,
+            ),
+            (
+                "sso disabled",
+                {},
+                ["reset_system_confirm.txt", "reset_system_restart.txt"],
+                [mock.call("reset system"), mock.call("y")],
+                True,
+            ),
+            (
+                "sso disabled",
+                {"controller": "both", "save_config": False},
+                ["reset_system_save.txt", "reset_system_confirm.txt", "reset_system_restart.txt"],
+                [mock.call("reset system"), mock.call("n"), mock.call("y")],
+                False,
+            ),
+        ),
+        ids=("confirm", "confirm_deprecation", "confirm_args", "confirm_standalone", "confirm_standalone_args"),
+        indirect=["aireos_redundancy_mode"],
     )
-    with mock.patch(aireos_redundancy_mode_path, new_callable=mock.PropertyMock) as redundnacy_mode:
-        redundnacy_mode.return_value = "sso disabled"
-        device.reboot(controller="both", save_config=False)
-    device.native.send_command_timing.assert_has_calls([mock.call("reset system"), mock.call("n"), mock.call("y")])
-    mock_save.assert_not_called()
+    @pytest.mark.usefixtures("aireos_redundancy_mode")
+    def test_reboot(
+        self, reboot_kwargs, side_effects, expected_calls, save_called, mock_save, aireos_send_command_timing
+    ):
+        device = aireos_send_command_timing(side_effects)
+        device.reboot(**reboot_kwargs)
+        device.native.send_command_timing.assert_has_calls(expected_calls)
+        assert mock_save.called is save_called
 
 
 def test_redundancy_mode_sso(aireos_show):
@@ -1238,22 +1039,26 @@ def test_redundancy_mode_standalone(aireos_show):
 
 
 @pytest.mark.parametrize(
-    "filename,expected",
+    "attr,filename,expected",
     (
-        ("show_redundancy_summary_sso_enabled", "active"),
-        ("show_redundancy_summary_standby", "standby hot"),
-        ("show_redundancy_summary_standalone", "active"),
+        ("peer_redundancy_state", "show_redundancy_summary_sso_enabled", "standby hot"),
+        ("peer_redundancy_state", "show_redundancy_summary_standby", "active"),
+        ("peer_redundancy_state", "show_redundancy_summary_standalone", "disabled"),
+        ("redundancy_state", "show_redundancy_summary_sso_enabled", "active"),
+        ("redundancy_state", "show_redundancy_summary_standby", "standby hot"),
+        ("redundancy_state", "show_redundancy_summary_standalone", "active"),
     ),
-    ids=("active", "standby_hot", "disabled"),
+    ids=("peer_standby_hot", "peer_active", "peer_disabled", "active", "standby_hot", "disabled"),
 )
-def test_redundancy_state(filename, expected, aireos_show):
+def test_redundancy_state(attr, filename, expected, aireos_show):
     device = aireos_show([f"{filename}.txt"])
-    assert device.redundancy_state == expected
+    assert getattr(device, attr) == expected
 
 
-def test_redundancy_state_unsupported(aireos_show):
+@pytest.mark.parametrize("attr", ("peer_redundancy_state", "redundancy_state"))
+def test_redundancy_state_unsupported(attr, aireos_show):
     device = aireos_show([aireos_module.CommandError("show redundancy summary", "unsupported")])
-    assert device.redundancy_state is None
+    assert getattr(device, attr) is None
 
 
 def test_save(aireos_device):
@@ -1262,410 +1067,311 @@ def test_save(aireos_device):
     assert save is True
 
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "save")
-def test_set_boot_options_primary(mock_save, mock_config, aireos_device, aireos_boot_image, aireos_boot_path):
-    with mock.patch(aireos_boot_path, new_callable=mock.PropertyMock) as boot_options:
-        boot_options.return_value = {"sys": aireos_boot_image, "primary": aireos_boot_image}
-        aireos_device.set_boot_options(aireos_boot_image)
-    mock_config.assert_called_with("boot primary")
-    mock_save.assert_called()
-
+class TestSetBootOptions:
+    @pytest.fixture(autouse=True)
+    def set_boot_options_mocks(self):
+        with mock.patch.multiple(AIREOSDevice, config=mock.DEFAULT, save=mock.DEFAULT) as mocks:
+            yield mocks
 
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "save")
-def test_set_boot_options_backup(mock_save, mock_config, aireos_device, aireos_boot_image, aireos_boot_path):
-    with mock.patch(aireos_boot_path, new_callable=mock.PropertyMock) as boot_options:
-        boot_options.return_value = {
-            "primary": "1",
-            "backup": aireos_boot_image,
-            "sys": aireos_boot_image,
-        }
-        aireos_device.set_boot_options(aireos_boot_image)
-    mock_config.assert_called_with("boot backup")
-    mock_save.assert_called()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "save")
-def test_set_boot_options_image_not_an_option(
-    mock_save, mock_config, aireos_device, aireos_boot_image, aireos_boot_path
-):
-    with mock.patch(aireos_boot_path, new_callable=mock.PropertyMock) as boot_options:
-        boot_options.return_value = {"primary": "1", "backup": "2"}
-        with pytest.raises(aireos_module.NTCFileNotFoundError) as fnfe:
-            aireos_device.set_boot_options(aireos_boot_image)
-            expected = f"{aireos_boot_image} was not found in 'show boot' on {aireos_device.host}"
-            assert fnfe.message == expected
-    mock_config.assert_not_called()
-    mock_save.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "save")
-def test_set_boot_options_error(mock_save, mock_config, aireos_device, aireos_boot_image, aireos_boot_path):
-    with mock.patch(aireos_boot_path, new_callable=mock.PropertyMock) as boot_options:
-        boot_options.return_value = {"primary": aireos_boot_image, "backup": "2", "sys": "1"}
-        with pytest.raises(aireos_module.CommandError) as ce:
-            aireos_device.set_boot_options(aireos_boot_image)
-            assert ce.command == "boot primary"
-    mock_config.assert_called()
-    mock_save.assert_called()
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_string(mock_check_for_errors, aireos_send_command):
-    command = "send command"
-    device = aireos_send_command([f"{command.replace(' ', '_')}.txt"])
-    result = device.show(command)
-    assert isinstance(result, str)
-    mock_check_for_errors.assert_called_once()
-    mock_check_for_errors.assert_called_with(command, result)
-    device.native.send_command.assert_called_with("send command")
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_list(mock_check_for_errors, aireos_send_command):
-    command = ["send command", "send command also"]
-    device = aireos_send_command([f"{cmd.replace(' ', '_')}.txt" for cmd in command])
-    result = device.show(command)
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert "also" not in result[0]
-    assert "also" in result[1]
-    mock_check_for_errors.assert_has_calls([mock.call(command[index], result[index]) for index in range(2)])
-    device.native.send_command.assert_has_calls(
-        [
-            mock.call("send command"),
-            mock.call("send command also"),
-        ]
+    @pytest.mark.parametrize(
+        "aireos_boot_options_value,expected_command",
+        (
+            ({"sys": BOOT_IMAGE, "primary": BOOT_IMAGE}, "boot primary"),
+            ({"primary": "1", "backup": BOOT_IMAGE, "sys": BOOT_IMAGE}, "boot backup"),
+        ),
+        indirect=["aireos_boot_options_value"],
+        ids=("primary", "backup"),
     )
+    @pytest.mark.usefixtures("aireos_boot_options_value")
+    def test_set_boot_options(self, expected_command, set_boot_options_mocks, aireos_device):
+        aireos_device.set_boot_options(BOOT_IMAGE)
+        set_boot_options_mocks["config"].assert_called_with(expected_command)
+        set_boot_options_mocks["save"].assert_called()
+
+    @pytest.mark.parametrize(
+        "aireos_boot_options_value,error,error_attrs,config_calls,save_called",
+        (
+            (
+                {"primary": "1", "backup": "2"},
+                aireos_module.NTCFileNotFoundError,
+                {"message": f"{BOOT_IMAGE} was not found in 'show boot' on host"},
+                [],
+                False,
+            ),
+            (
+                {"primary": BOOT_IMAGE, "backup": "2", "sys": "1"},
+                aireos_module.CommandError,
+                {"command": "boot primary"},
+                [mock.call("boot primary")],
+                True,
+            ),
+        ),
+        indirect=["aireos_boot_options_value"],
+        ids=("image_not_an_option", "boot_not_set"),
+    )
+    @pytest.mark.usefixtures("aireos_boot_options_value")
+    def test_set_boot_options_error(
+        self, error, error_attrs, config_calls, save_called, set_boot_options_mocks, aireos_device
+    ):
+        with pytest.raises(error) as err:
+            aireos_device.set_boot_options(BOOT_IMAGE)
+        for attr, expected in error_attrs.items():
+            assert getattr(err.value, attr) == expected
+        assert set_boot_options_mocks["config"].call_args_list == config_calls
+        assert set_boot_options_mocks["save"].called is save_called
+
+
+class TestShow:
+    @pytest.fixture(autouse=True)
+    def mock_check_for_errors(self, monkeypatch):
+        mock_check_for_errors = mock.Mock()
+        monkeypatch.setattr(AIREOSDevice, "_check_command_output_for_errors", mock_check_for_errors)
+        return mock_check_for_errors
+
+    def test_show_pass_string(self, mock_check_for_errors, aireos_send_command):
+        command = "send command"
+        device = aireos_send_command([f"{command.replace(' ', '_')}.txt"])
+        result = device.show(command)
+        assert isinstance(result, str)
+        mock_check_for_errors.assert_called_once()
+        mock_check_for_errors.assert_called_with(command, result)
+        device.native.send_command.assert_called_with("send command")
+
+    def test_show_pass_list(self, mock_check_for_errors, aireos_send_command):
+        command = ["send command", "send command also"]
+        device = aireos_send_command([f"{cmd.replace(' ', '_')}.txt" for cmd in command])
+        result = device.show(command)
+        assert isinstance(result, list)
+        assert len(result) == 2
+        assert "also" not in result[0]
+        assert "also" in result[1]
+        mock_check_for_errors.assert_has_calls([mock.call(command[index], result[index]) for index in range(2)])
+        device.native.send_command.assert_has_calls(
+            [
+                mock.call("send command"),
+                mock.call("send command also"),
+            ]
+        )
 
+    def test_show_pass_netmiko_args(self, aireos_device):
+        command = "send command"
+        netmiko_args = {"auto_find_prompt": False}
+        aireos_device.show(command, **netmiko_args)
+        aireos_device.native.send_command.assert_called_with(command, auto_find_prompt=False)
+
+    def test_show_pass_invalid_netmiko_args(self, mock_check_for_errors, aireos_send_command):
+        command = "send command"
+        error_message = "send_command() got an unexpected keyword argument 'invalid_arg'"
+        device = aireos_send_command([TypeError(error_message)])
+        netmiko_args = {"invalid_arg": True}
+        with pytest.raises(TypeError) as error:
+            device.show(command, **netmiko_args)
+
+        assert error.value.args[0] == (f"Netmiko Driver's {error_message}")
+        mock_check_for_errors.assert_not_called()
+        device.native.send_command.assert_called_with(command, invalid_arg=True)
+
+    def test_show_pass_expect_string(self, aireos_device):
+        command = "send command expect"
+        expect_string = "Continue?"
+        aireos_device.show(command, expect_string=expect_string)
+        aireos_device.native.send_command.assert_called_with(command, expect_string=expect_string)
+
+    def test_show_pass_expect_string_and_netmiko_args(self, aireos_device):
+        command = "send command expect"
+        expect_string = "Continue?"
+        netmiko_args = {"auto_find_prompt": False}
+        aireos_device.show(command, expect_string=expect_string, **netmiko_args)
+        aireos_device.native.send_command.assert_called_with(
+            command, expect_string=expect_string, auto_find_prompt=False
+        )
 
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_netmiko_args(mock_check_for_errors, aireos_send_command):
-    command = "send command"
-    device = aireos_send_command([""])
-    netmiko_args = {"auto_find_prompt": False}
-    device.show(command, **netmiko_args)
-    device.native.send_command.assert_called_with(command, auto_find_prompt=False)
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_invalid_netmiko_args(mock_check_for_errors, aireos_send_command):
-    command = "send command"
-    error_message = "send_command() got an unexpected keyword argument 'invalid_arg'"
-    device = aireos_send_command([TypeError(error_message)])
-    netmiko_args = {"invalid_arg": True}
-    with pytest.raises(TypeError) as error:
-        device.show(command, **netmiko_args)
-
-    assert error.value.args[0] == (f"Netmiko Driver's {error_message}")
-    mock_check_for_errors.assert_not_called()
-    device.native.send_command.assert_called_with(command, invalid_arg=True)
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_expect_string(mock_check_for_errors, aireos_send_command):
-    command = "send command expect"
-    expect_string = "Continue?"
-    device = aireos_send_command(["send_command_expect.txt"])
-    device.show(command, expect_string=expect_string)
-    device.native.send_command.assert_called_with(command, expect_string=expect_string)
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_expect_string_and_netmiko_args(mock_check_for_errors, aireos_send_command):
-    command = "send command expect"
-    expect_string = "Continue?"
-    device = aireos_send_command(["send_command_expect.txt"])
-    netmiko_args = {"auto_find_prompt": False}
-    device.show(command, expect_string=expect_string, **netmiko_args)
-    device.native.send_command.assert_called_with(command, expect_string=expect_string, auto_find_prompt=False)
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_invalid_string_command(mock_check_for_errors, aireos_send_command):
-    command = "send command error"
-    result = "Incorrect usage."
-    mock_check_for_errors.side_effect = [aireos_module.CommandError(command, result)]
-    device = aireos_send_command([result])
-    with pytest.raises(aireos_module.CommandError) as err:
-        device.show(command)
-
-    mock_check_for_errors.assert_called_once()
-    assert err.value.command == command
-    assert err.value.cli_error_msg == result
-
-
-@mock.patch.object(AIREOSDevice, "_check_command_output_for_errors")
-def test_show_pass_invalid_list_command(mock_check_for_errors, aireos_send_command):
-    command = ["send command", "send command error", "command not sent"]
-    result = ["Correct usage.", "Incorrect usage."]
-    mock_check_for_errors.side_effect = [None, aireos_module.CommandError(command[1], result[1])]
-    device = aireos_send_command(result)
-    with pytest.raises(aireos_module.CommandListError) as err:
-        device.show(command)
-
-    device.native.send_command.assert_has_calls((mock.call(command[0]), mock.call(command[1])))
-    assert mock.call(command[2]) not in device.native.send_command.call_args_list
-    mock_check_for_errors.assert_called_with(command[1], result[1])
-    assert err.value.command == command[1]
-    assert err.value.commands == command[:2]
-
-
-@mock.patch.object(AIREOSDevice, "show")
-def test_show_list(mock_show, aireos_device):
-    commands = ["a", "b"]
-    aireos_device.show(commands)
-    mock_show.assert_called_with(commands)
-
-
-@mock.patch.object(AIREOSDevice, "show")
-def test_show_list_pass_netmiko_args(mock_show, aireos_device):
-    commands = ["a", "b"]
-    netmiko_args = {"auto_find_prompt": False}
-    aireos_device.show(commands, **netmiko_args)
-    mock_show.assert_called_with(commands, auto_find_prompt=False)
-
-
-@mock.patch.object(AIREOSDevice, "show")
-def test_show_list_pass_expect_string(mock_show, aireos_device):
-    commands = ["a", "b"]
-    aireos_device.show(commands, expect_string="Continue?")
-    mock_show.assert_called_with(commands, expect_string="Continue?")
+    def test_show_pass_invalid_string_command(self, mock_check_for_errors, aireos_send_command):
+        command = "send command error"
+        result = "Incorrect usage."
+        mock_check_for_errors.side_effect = aireos_module.CommandError(command, result)
+        device = aireos_send_command([result])
+        with pytest.raises(aireos_module.CommandError) as err:
+            device.show(command)
+
+        mock_check_for_errors.assert_called_once()
+        assert err.value.command == command
+        assert err.value.cli_error_msg == result
+
+    def test_show_pass_invalid_list_command(self, mock_check_for_errors, aireos_send_command):
+        command = ["send command", "send command error", "command not sent"]
+        result = ["Correct usage.", "Incorrect usage."]
+        mock_check_for_errors.side_effect = [None, aireos_module.CommandError(command[1], result[1])]
+        device = aireos_send_command(result)
+        with pytest.raises(aireos_module.CommandListError) as err:
+            device.show(command)
+
+        device.native.send_command.assert_has_calls((mock.call(command[0]), mock.call(command[1])))
+        assert mock.call(command[2]) not in device.native.send_command.call_args_list
+        mock_check_for_errors.assert_called_with(command[1], result[1])
+        assert err.value.command == command[1]
+        assert err.value.commands == command[:2]
 
 
-@mock.patch.object(AIREOSDevice, "show")
-def test_show_list_pass_netmiko_args_and_expect_string(mock_show, aireos_device):
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"auto_find_prompt": False},
+        {"expect_string": "Continue?"},
+        {"expect_string": "Continue?", "auto_find_prompt": False},
+    ),
+    ids=("default", "netmiko_args", "expect_string", "netmiko_args_and_expect_string"),
+)
+@mock.patch.object(AIREOSDevice, "show", new_callable=mock.Mock)
+def test_show_list(mock_show, kwargs, aireos_device):
     commands = ["a", "b"]
-    netmiko_args = {"auto_find_prompt": False}
-    aireos_device.show(commands, expect_string="Continue?", **netmiko_args)
-    mock_show.assert_called_with(commands, expect_string="Continue?", auto_find_prompt=False)
-
-
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_transfer_image_to_ap_already_active(
-    mock_ap_boot_options, mock_ap_image_matches_expected, aireos_device, aireos_boot_image
-):
-    mock_ap_image_matches_expected.return_value = True
-    assert aireos_device.transfer_image_to_ap(aireos_boot_image) is False
-    mock_ap_image_matches_expected.assert_called_once()
-    mock_ap_boot_options.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_transfer_image_to_ap_already_transferred_primary(
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_ap_image_matches_expected.side_effect = [False, True, False, True]
-    assert aireos_device.transfer_image_to_ap(aireos_boot_image) is False
-    assert len(mock_ap_image_matches_expected.mock_calls) == 4
-    mock_config.assert_not_called()
-    mock_wait.assert_not_called()
-    mock_boot_options.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_transfer_image_to_ap_already_transferred_secondary(
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_ap_image_matches_expected.side_effect = [False, False, True, True, False, True]
-    assert aireos_device.transfer_image_to_ap(aireos_boot_image) is True
-    assert len(mock_ap_image_matches_expected.mock_calls) == 6
-    mock_config.assert_has_calls([mock.call("ap image swap all")])
-    mock_wait.assert_not_called()
-    mock_boot_options.assert_not_called()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-@mock.patch("pyntc.devices.aireos_device.log.error")
-def test_transfer_image_to_ap_already_transferred_secondary_fail(
-    mock_log,
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_ap_image_matches_expected.side_effect = [False, False, True, True, True, True, False]
-    with pytest.raises(aireos_module.FileTransferError):
-        aireos_device.transfer_image_to_ap(aireos_boot_image)
-    assert len(mock_ap_image_matches_expected.mock_calls) == 7
-    mock_config.assert_has_calls([mock.call("ap image swap all")] * 3)
-    mock_wait.assert_not_called()
-    mock_boot_options.assert_not_called()
-
-    mock_log.assert_called_once_with("Host %s: Unable to set all APs to use %s", "host", "8.2.170.0")
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_transfer_image_to_ap_transfer_primary(
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_boot_options.return_value = {"primary": aireos_boot_image, "backup": None}
-    mock_ap_image_matches_expected.side_effect = [False, False, False, False, True]
-    assert aireos_device.transfer_image_to_ap(aireos_boot_image) is True
-    assert len(mock_ap_image_matches_expected.mock_calls) == 5
-    mock_config.assert_has_calls([mock.call("ap image predownload primary all")])
-    mock_wait.assert_called()
-    mock_boot_options.assert_called_once()
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_transfer_image_to_ap_transfer_secondary(
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_boot_options.return_value = {"primary": None, "backup": aireos_boot_image}
-    mock_ap_image_matches_expected.side_effect = [False, False, False, True, False, True]
-    assert aireos_device.transfer_image_to_ap(aireos_boot_image) is True
-    assert len(mock_ap_image_matches_expected.mock_calls) == 6
-    mock_config.assert_has_calls([mock.call("ap image predownload backup all"), mock.call("ap image swap all")])
-    mock_wait.assert_called()
-    mock_boot_options.assert_has_calls([mock.call(), mock.call()])
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-@mock.patch("pyntc.devices.aireos_device.log.error")
-def test_transfer_image_to_ap_transfer_secondary_fail(
-    mock_log,
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_boot_options.return_value = {"primary": None, "backup": aireos_boot_image}
-    mock_ap_image_matches_expected.side_effect = [False, False, False, True, True, True, False]
-    with pytest.raises(aireos_module.FileTransferError):
-        aireos_device.transfer_image_to_ap(aireos_boot_image)
-    assert len(mock_ap_image_matches_expected.mock_calls) == 7
-    mock_config.assert_has_calls([mock.call("ap image predownload backup all")] + [mock.call("ap image swap all")] * 3)
-    mock_wait.assert_called()
-    mock_boot_options.assert_has_calls([mock.call(), mock.call()])
-
-    mock_log.assert_called_once_with("Host %s: Unable to set all APs to use %s", "host", "8.2.170.0")
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-def test_transfer_image_to_ap_transfer_fail_swap_at_first_try(
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_boot_options.return_value = {"primary": None, "backup": aireos_boot_image}
-    mock_ap_image_matches_expected.side_effect = [False, False, True, True, True, False, True]
-    assert aireos_device.transfer_image_to_ap(aireos_boot_image) is True
-    assert len(mock_ap_image_matches_expected.mock_calls) == 7
-    mock_config.assert_has_calls([mock.call("ap image swap all")] * 2)
-
-
-@mock.patch.object(AIREOSDevice, "config")
-@mock.patch.object(AIREOSDevice, "_wait_for_ap_image_download")
-@mock.patch.object(AIREOSDevice, "boot_options", new_callable=mock.PropertyMock)
-@mock.patch.object(AIREOSDevice, "_ap_images_match_expected")
-@mock.patch.object(AIREOSDevice, "ap_boot_options", new_callable=mock.PropertyMock)
-@mock.patch("pyntc.devices.aireos_device.log.error")
-def test_transfer_image_does_not_exist(
-    mock_log,
-    mock_ap_boot_options,
-    mock_ap_image_matches_expected,
-    mock_boot_options,
-    mock_wait,
-    mock_config,
-    aireos_device,
-    aireos_mock_path,
-    aireos_boot_image,
-):
-    mock_boot_options.return_value = {"primary": None, "backup": None}
-    mock_ap_image_matches_expected.return_value = False
-    with pytest.raises(aireos_module.FileTransferError):
-        aireos_device.transfer_image_to_ap(aireos_boot_image)
-    assert len(mock_ap_image_matches_expected.mock_calls) == 3
-    mock_config.assert_not_called()
-    mock_wait.assert_not_called()
-    mock_boot_options.assert_has_calls([mock.call(), mock.call()])
-    mock_log.assert_called_once_with("Host %s: Unable to find %s on host.", "host", "8.2.170.0")
-
-
-@mock.patch.object(AIREOSDevice, "_uptime_components")
-def test_uptime(mock_uptime_components, aireos_device):
-    mock_uptime_components.side_effect = [(3, 2, 20)]
-    assert aireos_device.uptime == 267600
-
-
-@mock.patch.object(AIREOSDevice, "_uptime_components")
-def test_uptime_string(mock_uptime_components, aireos_device):
-    mock_uptime_components.side_effect = [(3, 2, 20)]
-    assert aireos_device.uptime_string == "03:02:20:00"
+    aireos_device.show(commands, **kwargs)
+    mock_show.assert_called_with(commands, **kwargs)
+
+
+class TestTransferImageToAp:
+    @pytest.fixture
+    def transfer_mocks(self, aireos_device, aireos_clock):
+        with mock.patch.multiple(
+            AIREOSDevice,
+            config=mock.DEFAULT,
+            _wait_for_ap_image_download=mock.DEFAULT,
+            _ap_images_match_expected=mock.DEFAULT,
+        ) as mocks:
+            with mock.patch.multiple(
+                AIREOSDevice, ap_boot_options=mock.DEFAULT, boot_options=mock.DEFAULT, new_callable=mock.PropertyMock
+            ) as property_mocks:
+                with mock.patch("pyntc.devices.aireos_device.log.error") as mock_log_error:
+                    mocks.update(property_mocks, log_error=mock_log_error)
+                    yield mocks
+
+    @pytest.mark.parametrize(
+        "images_match,boot_options,expected,expected_calls",
+        (
+            (
+                [True],
+                None,
+                False,
+                {"config": [], "_wait_for_ap_image_download": [], "boot_options": [], "log_error": []},
+            ),
+            (
+                [False, True, False, True],
+                None,
+                False,
+                {"config": [], "_wait_for_ap_image_download": [], "boot_options": [], "log_error": []},
+            ),
+            (
+                [False, False, True, True, False, True],
+                None,
+                True,
+                {
+                    "config": [mock.call("ap image swap all")],
+                    "_wait_for_ap_image_download": [],
+                    "boot_options": [],
+                    "log_error": [],
+                },
+            ),
+            (
+                [False, False, True, True, True, True, False],
+                None,
+                aireos_module.FileTransferError,
+                {
+                    "config": [mock.call("ap image swap all")] * 3,
+                    "_wait_for_ap_image_download": [],
+                    "boot_options": [],
+                    "log_error": [mock.call("Host %s: Unable to set all APs to use %s", "host", BOOT_IMAGE)],
+                },
+            ),
+            (
+                [False, False, False, False, True],
+                {"primary": BOOT_IMAGE, "backup": None},
+                True,
+                {
+                    "config": [mock.call("ap image predownload primary all")],
+                    "_wait_for_ap_image_download": [mock.call()],
+                    "boot_options": [mock.call()],
+                    "log_error": [],
+                },
+            ),
+            (
+                [False, False, False, True, False, True],
+                {"primary": None, "backup": BOOT_IMAGE},
+                True,
+                {
+                    "config": [mock.call("ap image predownload backup all"), mock.call("ap image swap all")],
+                    "_wait_for_ap_image_download": [mock.call()],
+                    "boot_options": [mock.call()] * 2,
+                    "log_error": [],
+                },
+            ),
+            (
+                [False, False, False, True, True, True, False],
+                {"primary": None, "backup": BOOT_IMAGE},
+                aireos_module.FileTransferError,
+                {
+                    "config": [mock.call("ap image predownload backup all")] + [mock.call("ap image swap all")] * 3,
+                    "_wait_for_ap_image_download": [mock.call()],
+                    "boot_options": [mock.call()] * 2,
+                    "log_error": [mock.call("Host %s: Unable to set all APs to use %s", "host", BOOT_IMAGE)],
+                },
+            ),
+            (
+                [False, False, True, True, True, False, True],
+                {"primary": None, "backup": BOOT_IMAGE},
+                True,
+                {
+                    "config": [mock.call("ap image swap all")] * 2,
+                    "_wait_for_ap_image_download": [],
+                    "boot_options": [],
+                    "log_error": [],
+                },
+            ),
+            (
+                [False] * 3,
+                {"primary": None, "backup": None},
+                aireos_module.FileTransferError,
+                {
+                    "config": [],
+                    "_wait_for_ap_image_download": [],
+                    "boot_options": [mock.call()] * 2,
+                    "log_error": [mock.call("Host %s: Unable to find %s on host.", "host", BOOT_IMAGE)],
+                },
+            ),
+        ),
+        ids=(
+            "already_active",
+            "already_transferred_primary",
+            "already_transferred_secondary",
+            "already_transferred_secondary_fail",
+            "transfer_primary",
+            "transfer_secondary",
+            "transfer_secondary_fail",
+            "transfer_fail_swap_at_first_try",
+            "does_not_exist",
+        ),
+    )
+    def test_transfer_image_to_ap(
+        self, images_match, boot_options, expected, expected_calls, transfer_mocks, aireos_device
+    ):
+        transfer_mocks["_ap_images_match_expected"].side_effect = images_match
+        transfer_mocks["boot_options"].return_value = boot_options
+        if expected is aireos_module.FileTransferError:
+            with pytest.raises(expected):
+                aireos_device.transfer_image_to_ap(BOOT_IMAGE)
+        else:
+            assert aireos_device.transfer_image_to_ap(BOOT_IMAGE) is expected
+
+        transfer_mocks["ap_boot_options"].assert_called_once()
+        assert transfer_mocks["_ap_images_match_expected"].call_count == len(images_match)
+        for name, calls in expected_calls.items():
+            assert transfer_mocks[name].call_args_list == calls
+
+
+@pytest.mark.parametrize("attr,expected", (("uptime", 267600), ("uptime_string", "03:02:20:00")))
+def test_uptime(attr, expected, aireos_device, monkeypatch):
+    monkeypatch.setattr(AIREOSDevice, "_uptime_components", mock.Mock(return_value=(3, 2, 20)))
+    assert getattr(aireos_device, attr) == expected
 
 
 def test_wlans(aireos_show, aireos_expected_wlans):